@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import socket
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 import urllib3
@@ -19,6 +20,8 @@ class MusicBrainzClient:
     Notes:
     - MusicBrainz asks clients to throttle to ~1 req/sec and to send a custom User-Agent.
     - Responses are JSON when `fmt=json` is provided.
+    - Successful responses are memoized per client instance, so duplicate
+      inventory rows (several copies of one pressing) cost one request.
     """
 
     def __init__(
@@ -36,20 +39,41 @@ class MusicBrainzClient:
         self.session.headers.update({"User-Agent": user_agent})
         self.min_interval = 1.0 / max(0.1, calls_per_second)
         self._last_call_ts = 0.0
+        # Shared by all threads using this client so the 1 req/sec pacing holds.
+        self._rate_lock = threading.Lock()
+        # (path, sorted params) -> parsed JSON. The per-key locks make a
+        # thread asking for a request already in flight wait for its answer
+        # instead of sending a duplicate.
+        self._cache: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._key_locks: Dict[Tuple[Any, ...], threading.Lock] = {}
 
     def _sleep_for_rate_limit(self) -> None:
-        now = time.time()
-        elapsed = now - self._last_call_ts
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self._last_call_ts = time.time()
+        with self._rate_lock:
+            now = time.time()
+            elapsed = now - self._last_call_ts
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            self._last_call_ts = time.time()
 
     def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        self._sleep_for_rate_limit()
-        url = f"{BASE_URL}/{path.lstrip('/')}"
-        resp = self.session.get(url, params=params, timeout=15)
-        resp.raise_for_status()
-        return resp.json()
+        key = (path, tuple(sorted(params.items())))
+        with self._cache_lock:
+            if key in self._cache:
+                return self._cache[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._cache_lock:
+                if key in self._cache:
+                    return self._cache[key]
+            self._sleep_for_rate_limit()
+            url = f"{BASE_URL}/{path.lstrip('/')}"
+            resp = self.session.get(url, params=params, timeout=15)
+            resp.raise_for_status()
+            data = resp.json()
+            with self._cache_lock:
+                self._cache[key] = data
+            return data
 
     def search_release(
         self,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 import requests
 from uf_logging import get_logger
@@ -31,6 +32,8 @@ SHOPIFY_CATEGORY_QUERIES = [
 ]
 # Expected product_type for records; used as a guard when missing.
 SHOPIFY_DEFAULT_PRODUCT_TYPE = "Vinyl Record"
+# Image URLs of one product probed concurrently during preflight.
+IMAGE_PREFLIGHT_WORKERS = 4
 
 
 class ShopifyAPIExporter(Exporter):
@@ -58,25 +61,35 @@ class ShopifyAPIExporter(Exporter):
         self.duplicates: List[str] = []
         self._product_taxonomy_node_id: Optional[str] = None
 
+    def _preflight_image(self, url: str) -> None:
+        try:
+            resp = requests.get(url, stream=True, timeout=8)
+            content_type = resp.headers.get("Content-Type")
+            content_length = resp.headers.get("Content-Length")
+            logger.info(
+                "Image preflight url=%s status=%s content_type=%s content_length=%s",
+                url,
+                resp.status_code,
+                content_type,
+                content_length,
+            )
+            resp.close()
+        except Exception as exc:
+            logger.warning("Image preflight failed for %s: %s", url, exc)
+
     def _preflight_images(self, images: List[str]) -> None:
         """
         Best-effort fetch to see if image URLs are reachable before sending to Shopify.
+
+        The probes are independent, so a product's images are checked in
+        parallel and the wait is the slowest URL rather than their sum.
         """
-        for url in images:
-            try:
-                resp = requests.get(url, stream=True, timeout=8)
-                content_type = resp.headers.get("Content-Type")
-                content_length = resp.headers.get("Content-Length")
-                logger.info(
-                    "Image preflight url=%s status=%s content_type=%s content_length=%s",
-                    url,
-                    resp.status_code,
-                    content_type,
-                    content_length,
-                )
-                resp.close()
-            except Exception as exc:
-                logger.warning("Image preflight failed for %s: %s", url, exc)
+        if len(images) <= 1:
+            for url in images:
+                self._preflight_image(url)
+            return
+        with ThreadPoolExecutor(max_workers=min(IMAGE_PREFLIGHT_WORKERS, len(images))) as pool:
+            list(pool.map(self._preflight_image, images))
 
     def _build_payload(self, draft: ShopifyDraft) -> dict:
         status = "active" if self.publish else "draft"
@@ -12,10 +12,24 @@ All network calls to Discogs should go through this module instead of calling
 
 from __future__ import annotations
 
+import json
+import random
+import sqlite3
+import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 from uf_logging import get_logger
 
@@ -24,6 +38,195 @@ logger = get_logger(__name__)
 DISCOGS_API_BASE = "https://api.discogs.com"
 USER_AGENT = "UnusualFindsDiscogsShopify/1.0 +https://unusualfinds.com"
 
+# Endpoint URLs, built once rather than concatenated on every request.
+SEARCH_URL = DISCOGS_API_BASE + "/database/search"
+RELEASE_URL_TEMPLATE = DISCOGS_API_BASE + "/releases/{}"
+MARKETPLACE_STATS_URL_TEMPLATE = DISCOGS_API_BASE + "/marketplace/stats/{}"
+PRICE_SUGGESTIONS_URL_TEMPLATE = DISCOGS_API_BASE + "/marketplace/price_suggestions/{}"
+
+# Client-side rate limit for Discogs calls. The authenticated limit is
+# 60 requests/minute and the unauthenticated one 25; staying a little under
+# each leaves headroom for clock skew.
+DISCOGS_MAX_REQUESTS = 55
+DISCOGS_ANON_MAX_REQUESTS = 22
+DISCOGS_RATE_PERIOD = 60.0
+
+# Keep-alive connections held open to api.discogs.com; sized to cover the
+# GUI's lookup workers plus its marketplace side pool (4 + 8 concurrent
+# requests), so no finished connection is discarded for lack of a pool slot.
+DISCOGS_POOL_SIZE = 16
+
+# Retry backoff ("decorrelated jitter"): each wait is drawn from
+# [BACKOFF_BASE, previous wait * 3] and capped at BACKOFF_CAP seconds.
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 10.0
+
+# How long a stored response is served straight from the SQLite store with
+# no request at all. Older entries are revalidated with If-None-Match.
+RELEASE_CACHE_TTL = 7 * 24 * 3600.0
+SEARCH_CACHE_TTL = 24 * 3600.0
+MARKETPLACE_CACHE_TTL = 12 * 3600.0
+
+# SQLite file holding ETags + response bodies for conditional GETs.
+DEFAULT_ETAG_CACHE_PATH = Path.home() / ".discogs_to_shopify" / "discogs_etag_cache.sqlite"
+
+
+# ---------------------------------------------------------------------------
+# JSON decoding
+# ---------------------------------------------------------------------------
+
+def _parse_json(resp: requests.Response) -> Any:
+    """
+    Decode a Discogs response body, using orjson when it is installed.
+
+    Discogs always sends UTF-8, so the raw bytes are parsed directly
+    instead of going through requests' text decoding.
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return json.loads(resp.content)
+
+
+# ---------------------------------------------------------------------------
+# Client-side rate limiter
+# ---------------------------------------------------------------------------
+
+class _RateLimiter:
+    """
+    Thread-safe leaky-bucket limiter: allows a burst of up to `max_rate`
+    requests, then paces callers to `max_rate` per `time_period` seconds.
+
+    Every outgoing Discogs request acquires a slot first, so concurrent
+    lookups stay under the API limit instead of tripping 429s.
+    """
+
+    def __init__(self, max_rate: float, time_period: float) -> None:
+        self.max_rate = float(max_rate)
+        self.time_period = float(time_period)
+        self._level = 0.0
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                drained = (now - self._last) * (self.max_rate / self.time_period)
+                self._level = max(0.0, self._level - drained)
+                self._last = now
+                if self._level + 1 <= self.max_rate:
+                    self._level += 1
+                    return
+                wait = (self._level + 1 - self.max_rate) * (self.time_period / self.max_rate)
+            time.sleep(wait)
+
+    def observe_remaining(self, remaining: int) -> None:
+        """
+        Never allow more immediate requests than the server says are left in
+        its window (X-Discogs-Ratelimit-Remaining). Other clients sharing the
+        token spend the same budget, so a low count raises the bucket level
+        and paces every worker; a full budget leaves the bucket untouched.
+        """
+        with self._lock:
+            self._level = max(self._level, self.max_rate - max(0, remaining))
+
+
+_rate_limiter = _RateLimiter(DISCOGS_MAX_REQUESTS, DISCOGS_RATE_PERIOD)
+_anon_rate_limiter = _RateLimiter(DISCOGS_ANON_MAX_REQUESTS, DISCOGS_RATE_PERIOD)
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET (ETag / If-None-Match) store
+# ---------------------------------------------------------------------------
+
+class _ETagStore:
+    """
+    Tiny SQLite store of (etag, zlib-compressed body, fetched_at) keyed by
+    request URL.
+
+    Entries younger than the caller's max_age are served without touching
+    the network (so a restarted run replays finished lookups instantly);
+    older ones are revalidated with If-None-Match so Discogs can answer
+    with an empty 304 instead of re-sending the full JSON payload.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock:
+            # Every put/touch commits on its own. In WAL mode with
+            # synchronous=NORMAL those commits append to the log without an
+            # fsync each, instead of rewriting a rollback journal per call.
+            # A crash can at worst drop the newest cache entries.
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, etag TEXT NOT NULL, body BLOB NOT NULL, "
+                "fetched_at REAL NOT NULL DEFAULT 0)"
+            )
+            columns = {r[1] for r in self._conn.execute("PRAGMA table_info(responses)")}
+            if "fetched_at" not in columns:
+                # Stores created before the TTL existed: treat entries as stale.
+                self._conn.execute(
+                    "ALTER TABLE responses ADD COLUMN fetched_at REAL NOT NULL DEFAULT 0"
+                )
+            self._conn.commit()
+
+    def get(self, url: str) -> Optional[Tuple[str, bytes, float]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, body, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], row[2]
+
+    def put(self, url: str, etag: str, body: bytes) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, body, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (url, etag, zlib.compress(body, 1), time.time()),
+            )
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark an entry fresh again after a 304 confirmed it is unchanged."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url)
+            )
+            self._conn.commit()
+
+
+_etag_cache_path: Path = DEFAULT_ETAG_CACHE_PATH
+_etag_store: Optional[_ETagStore] = None
+_etag_store_failed = False
+
+
+def set_etag_cache_path(path: Path) -> None:
+    """
+    Point the conditional-GET store at a different SQLite file
+    (e.g. the app's cache folder). Takes effect on the next request.
+    """
+    global _etag_cache_path, _etag_store, _etag_store_failed
+    _etag_cache_path = Path(path)
+    _etag_store = None
+    _etag_store_failed = False
+
+
+def _get_etag_store() -> Optional[_ETagStore]:
+    global _etag_store, _etag_store_failed
+    if _etag_store is None and not _etag_store_failed:
+        try:
+            _etag_store = _ETagStore(_etag_cache_path)
+        except Exception as e:
+            _etag_store_failed = True
+            logger.warning("Discogs ETag cache disabled (%s): %s", _etag_cache_path, e)
+    return _etag_store
+
 
 # ---------------------------------------------------------------------------
 # Internal helper
@@ -41,28 +244,102 @@ def _build_headers(token: str) -> Dict[str, str]:
     return headers
 
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Shared Session for all Discogs calls, so TCP/TLS connections and DNS
+    lookups are reused instead of being set up again for every request.
+
+    Retries stay in _safe_get (with Retry-After and jittered backoff), so
+    the adapter itself is mounted without urllib3 retries.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = USER_AGENT
+                session.mount(
+                    "https://",
+                    HTTPAdapter(pool_connections=1, pool_maxsize=DISCOGS_POOL_SIZE),
+                )
+                _session = session
+    return _session
+
+
+def _next_backoff(prev: float) -> float:
+    """
+    Decorrelated-jitter backoff so concurrent callers that hit a 429/5xx at
+    the same moment do not all retry in lockstep.
+    """
+    return min(BACKOFF_CAP, random.uniform(BACKOFF_BASE, prev * 3))
+
+
+def _retry_after_seconds(resp: requests.Response) -> Optional[float]:
+    """
+    Parse a numeric Retry-After header (seconds), if present.
+    """
+    value = resp.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
 def _safe_get(
-    path: str,
+    url: str,
     token: str,
     params: Optional[Dict[str, Any]] = None,
     max_retries: int = 5,
     timeout: int = 40,
+    max_age: Optional[float] = None,
 ) -> Optional[requests.Response]:
     """
-    Perform a GET with retry and simple backoff.
+    Perform a GET with retry and jittered backoff.
     Returns a Response on success, or None if all retries fail.
+
+    With `max_age` (seconds), a stored response younger than that is
+    returned without a request and without taking a rate-limit slot.
     """
-    url = f"{DISCOGS_API_BASE}{path}"
     headers = _build_headers(token)
     params = params or {}
 
-    backoff = 1.0
-    base_delay = 0.5  # small delay between attempts to ease rate limits
-    time.sleep(base_delay)
+    # Conditional GET: replay the stored ETag so an unchanged resource
+    # comes back as a bodiless 304.
+    cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    store = _get_etag_store()
+    cached = None
+    cached_body = b""
+    if store:
+        # A locked database or corrupt row is just a cache miss.
+        try:
+            cached = store.get(cache_key)
+            if cached:
+                cached_body = zlib.decompress(cached[1])
+        except Exception as e:
+            logger.warning("Ignoring unreadable Discogs cache entry for %s: %s", url, e)
+            cached = None
+    if cached and max_age is not None and time.time() - cached[2] < max_age:
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = url
+        resp._content = cached_body
+        return resp
+    if cached and cached[0]:
+        headers["If-None-Match"] = cached[0]
+
+    backoff = BACKOFF_BASE
+    limiter = _rate_limiter if "Authorization" in headers else _anon_rate_limiter
 
     for attempt in range(1, max_retries + 1):
+        limiter.acquire()
         try:
-            resp = requests.get(url, headers=headers, params=params, timeout=timeout)
+            resp = _get_session().get(url, headers=headers, params=params, timeout=timeout)
         except requests.exceptions.RequestException as e:
             logger.warning(
                 "Discogs GET failed (attempt %d/%d) %s: %s",
@@ -73,25 +350,29 @@ def _safe_get(
             )
             if attempt == max_retries:
                 return None
+            backoff = _next_backoff(backoff)
             time.sleep(backoff)
-            backoff = min(backoff * 2, 10.0)
             continue
 
-        # Basic rate-limit handling
+        # Keep the local bucket in step with the server-side budget
         remaining = resp.headers.get("X-Discogs-Ratelimit-Remaining")
-        try:
-            if remaining is not None and int(remaining) < 5:
-                time.sleep(1.0)
-        except ValueError:
-            pass
+        if remaining is not None:
+            try:
+                limiter.observe_remaining(int(remaining))
+            except ValueError:
+                pass
 
         if resp.status_code == 429:
             # Rate limited — back off and retry
             logger.warning("Discogs rate limit hit on %s (attempt %d/%d)", url, attempt, max_retries)
             if attempt == max_retries:
                 return None
-            time.sleep(max(backoff, 3.0))
-            backoff = min(backoff * 2, 10.0)
+            retry_after = _retry_after_seconds(resp)
+            if retry_after is not None:
+                time.sleep(retry_after)
+            else:
+                backoff = _next_backoff(backoff)
+                time.sleep(max(backoff, 3.0))
             continue
 
         if 500 <= resp.status_code < 600:
@@ -105,16 +386,248 @@ def _safe_get(
             )
             if attempt == max_retries:
                 return None
-            time.sleep(backoff)
-            backoff = min(backoff * 2, 10.0)
+            retry_after = _retry_after_seconds(resp)
+            if retry_after is not None:
+                time.sleep(retry_after)
+            else:
+                backoff = _next_backoff(backoff)
+                time.sleep(backoff)
             continue
 
+        if resp.status_code == 304 and cached:
+            # Not modified: serve the stored body as a normal 200 response.
+            resp.status_code = 200
+            resp._content = cached_body
+            try:
+                store.touch(cache_key)
+            except Exception as e:
+                logger.warning("Failed to refresh Discogs cache entry for %s: %s", url, e)
+            return resp
+
+        if resp.status_code == 200 and store:
+            try:
+                store.put(cache_key, resp.headers.get("ETag") or "", resp.content)
+            except Exception as e:
+                logger.warning("Failed to store Discogs response for %s: %s", url, e)
+
         # For all other statuses, return the response (caller can check .ok)
         return resp
 
     return None
 
 
+def _intern_str(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _intern_release_fields(release: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Intern the low-cardinality strings of a release payload (country,
+    release date, genres/styles, label and format names) so a bulk run keeps
+    one copy of "US", "Vinyl", "Blue Note", ... instead of one per release.
+    Tracklist strings are left alone; they are almost always unique.
+    """
+    for key in ("country", "released"):
+        if key in release:
+            release[key] = _intern_str(release[key])
+    for key in ("genres", "styles"):
+        values = release.get(key)
+        if isinstance(values, list):
+            release[key] = [_intern_str(v) for v in values]
+    for lbl in release.get("labels") or []:
+        if isinstance(lbl, dict) and "name" in lbl:
+            lbl["name"] = _intern_str(lbl["name"])
+    for fmt in release.get("formats") or []:
+        if not isinstance(fmt, dict):
+            continue
+        if "name" in fmt:
+            fmt["name"] = _intern_str(fmt["name"])
+        descriptions = fmt.get("descriptions")
+        if isinstance(descriptions, list):
+            fmt["descriptions"] = [_intern_str(d) for d in descriptions]
+    return release
+
+
+def _make_release_getter(
+    url_template: str,
+    what: str,
+    postprocess: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    max_age: Optional[float] = None,
+) -> Callable[[str, int], Tuple[Optional[Dict[str, Any]], Optional[int]]]:
+    """
+    Build a fetcher for one of the hot /{release_id} endpoints.
+
+    These endpoints never take query params, so the returned function only
+    formats the prebuilt URL template and parses the JSON body; search keeps
+    using _safe_get directly with its varying params.
+
+    The fetcher returns (data, status): the HTTP status Discogs answered with,
+    or None when no answer came back (transport errors, or 429/5xx after all
+    retries).
+    """
+
+    def fetch(token: str, release_id: int) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+        resp = _safe_get(url_template.format(release_id), token, max_age=max_age)
+        status = getattr(resp, "status_code", None)
+        if resp is None or not resp.ok:
+            logger.warning(
+                "Discogs %s fetch failed for %s (resp=%s)",
+                what,
+                release_id,
+                status,
+            )
+            return None, status
+
+        try:
+            data = _parse_json(resp)
+        except Exception as e:
+            logger.warning("Discogs %s JSON parse failed for %s: %s", what, release_id, e)
+            return None, status
+
+        if postprocess is not None and isinstance(data, dict):
+            data = postprocess(data)
+        return data, status
+
+    return fetch
+
+
+def is_permanent_failure(status: Optional[int]) -> bool:
+    """
+    True when Discogs definitively refused a request (a 4xx such as 404 for a
+    deleted release), so retrying it later cannot succeed. Transport errors
+    and exhausted 429/5xx retries come back with no status and stay retryable.
+    """
+    return status is not None and 400 <= status < 500
+
+
+_get_release = _make_release_getter(
+    RELEASE_URL_TEMPLATE,
+    "release",
+    postprocess=_intern_release_fields,
+    max_age=RELEASE_CACHE_TTL,
+)
+_get_marketplace_stats = _make_release_getter(
+    MARKETPLACE_STATS_URL_TEMPLATE, "marketplace stats", max_age=MARKETPLACE_CACHE_TTL
+)
+_get_price_suggestions = _make_release_getter(
+    PRICE_SUGGESTIONS_URL_TEMPLATE, "price suggestions", max_age=MARKETPLACE_CACHE_TTL
+)
+
+
+class _SingleFlightCache:
+    """
+    In-process memo whose concurrent misses for the same key share a single
+    fetch: per-key locks make the other lookup workers wait for the first
+    request instead of issuing their own.
+
+    `fetch` returns (cacheable, value); uncacheable values (failed requests)
+    are handed back but not stored, so the retry pass can try again.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Any, Any] = {}
+        self._key_locks: Dict[Any, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key: Any, fetch: Callable[[], Tuple[bool, Any]]) -> Any:
+        if key in self._values:
+            return self._values[key]
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key in self._values:
+                return self._values[key]
+            cacheable, value = fetch()
+            if cacheable:
+                self._values[key] = value
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._key_locks.clear()
+
+
+# Each release_id and each distinct search is fetched at most once per run.
+_release_cache = _SingleFlightCache()
+_search_cache = _SingleFlightCache()
+_marketplace_stats_cache = _SingleFlightCache()
+_price_suggestions_cache = _SingleFlightCache()
+
+
+def _fetch_for_cache(
+    getter: Callable[[str, int], Tuple[Optional[Dict[str, Any]], Optional[int]]],
+    token: str,
+    release_id: int,
+) -> Tuple[bool, Tuple[Optional[Dict[str, Any]], Optional[int]]]:
+    # Successes and permanent refusals are remembered; transient failures are
+    # not, so the retry pass asks again.
+    data, status = getter(token, release_id)
+    return data is not None or is_permanent_failure(status), (data, status)
+
+
+def _get_release_cached(
+    token: str, release_id: int
+) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+    release, status = _release_cache.get_or_fetch(
+        int(release_id), lambda: _fetch_for_cache(_get_release, token, release_id)
+    )
+    # Callers attach per-row extras to the dict, so hand out a shallow copy.
+    return (dict(release) if release is not None else None), status
+
+
+def _get_marketplace_cached(
+    cache: _SingleFlightCache,
+    getter: Callable[[str, int], Tuple[Optional[Dict[str, Any]], Optional[int]]],
+    token: str,
+    release_id: int,
+) -> Optional[Dict[str, Any]]:
+    data, _status = cache.get_or_fetch(
+        int(release_id), lambda: _fetch_for_cache(getter, token, release_id)
+    )
+    # Payloads end up on ReleaseMatch and row details, so hand out a shallow copy.
+    return dict(data) if data is not None else None
+
+
+def clear_release_cache() -> None:
+    """
+    Drop all in-memory release details, marketplace data and search results
+    (at the start of a run, or when the token changes).
+    """
+    _release_cache.clear()
+    _search_cache.clear()
+    _marketplace_stats_cache.clear()
+    _price_suggestions_cache.clear()
+
+
+def _search_first_result(
+    token: str, params: Dict[str, Any]
+) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    Run one search request. Returns (ok, first_result); "no results" is a
+    successful answer and is cached, transport/HTTP/parse failures are not.
+    """
+    logger.info("Discogs search params: %s", params)
+
+    resp = _safe_get(SEARCH_URL, token, params=params, max_age=SEARCH_CACHE_TTL)
+    if resp is None:
+        logger.warning("Discogs search failed (no response) for query %r", params.get("q"))
+        return False, None
+
+    if not resp.ok:
+        logger.warning("Discogs search HTTP %s: %s", resp.status_code, resp.text)
+        return False, None
+
+    try:
+        data = _parse_json(resp)
+    except Exception as e:
+        logger.warning("Discogs search JSON parse failed: %s", e)
+        return False, None
+
+    results = data.get("results") or []
+    return True, (results[0] if results else None)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -145,88 +658,51 @@ def search_release(
     if catalog:
         params["catno"] = catalog
 
-    logger.info("Discogs search params: %s", params)
-
-    resp = _safe_get("/database/search", token, params=params)
-    if resp is None:
-        logger.warning("Discogs search failed (no response) for query %r", query)
-        return None
-
-    if not resp.ok:
-        logger.warning("Discogs search HTTP %s: %s", resp.status_code, resp.text)
-        return None
-
-    try:
-        data = resp.json()
-    except Exception as e:
-        logger.warning("Discogs search JSON parse failed: %s", e)
-        return None
-
-    results = data.get("results") or []
-    if not results:
-        return None
-
-    return results[0]
+    # Discogs search is case-insensitive, so differently-cased copies of the
+    # same record share one cache entry.
+    key = tuple(
+        sorted(
+            (k, v.strip().lower() if isinstance(v, str) else v)
+            for k, v in params.items()
+        )
+    )
+    result = _search_cache.get_or_fetch(key, lambda: _search_first_result(token, params))
+    return dict(result) if result is not None else None
 
 
 def get_release_details(token: str, release_id: int) -> Optional[Dict[str, Any]]:
     """
-    Fetch /releases/{id}.
+    Fetch /releases/{id}, memoized per release_id for the life of the process.
     """
-    resp = _safe_get(f"/releases/{release_id}", token)
-    if resp is None or not resp.ok:
-        logger.warning(
-            "Discogs release fetch failed for %s (resp=%s)",
-            release_id,
-            getattr(resp, "status_code", None),
-        )
-        return None
+    return _get_release_cached(token, release_id)[0]
 
-    try:
-        return resp.json()
-    except Exception as e:
-        logger.warning("Discogs release JSON parse failed for %s: %s", release_id, e)
-        return None
+
+def get_release_details_with_status(
+    token: str, release_id: int
+) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
+    """
+    Like get_release_details, but also return the HTTP status Discogs
+    answered with (None if no answer), so callers can tell a deleted release
+    (see is_permanent_failure) from a transient failure.
+    """
+    return _get_release_cached(token, release_id)
 
 
 def get_marketplace_stats(token: str, release_id: int) -> Optional[Dict[str, Any]]:
     """
-    Fetch /marketplace/stats/{release_id}.
+    Fetch /marketplace/stats/{release_id}, memoized per release_id.
     """
-    resp = _safe_get(f"/marketplace/stats/{release_id}", token)
-    if resp is None or not resp.ok:
-        logger.warning(
-            "Discogs marketplace stats fetch failed for %s (resp=%s)",
-            release_id,
-            getattr(resp, "status_code", None),
-        )
-        return None
-
-    try:
-        return resp.json()
-    except Exception as e:
-        logger.warning("Discogs stats JSON parse failed for %s: %s", release_id, e)
-        return None
+    return _get_marketplace_cached(
+        _marketplace_stats_cache, _get_marketplace_stats, token, release_id
+    )
 
 
 def get_price_suggestions(token: str, release_id: int) -> Optional[Dict[str, Any]]:
     """
     Fetch /marketplace/price_suggestions/{release_id}.
     Returns a dict keyed by condition name with {"value": float, "currency": "..."}.
+    Memoized per release_id.
     """
-    resp = _safe_get(f"/marketplace/price_suggestions/{release_id}", token)
-    if resp is None or not resp.ok:
-        logger.warning(
-            "Discogs price suggestions fetch failed for %s (resp=%s)",
-            release_id,
-            getattr(resp, "status_code", None),
-        )
-        return None
-
-    try:
-        return resp.json()
-    except Exception as e:
-        logger.warning(
-            "Discogs price suggestions JSON parse failed for %s: %s", release_id, e
-        )
-        return None
+    return _get_marketplace_cached(
+        _price_suggestions_cache, _get_price_suggestions, token, release_id
+    )
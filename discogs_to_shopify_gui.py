@@ -103,20 +103,25 @@ import sys
 import csv
 import time
 import json
+import html
 import logging
 import datetime as dt
 import re
 import subprocess
 import shutil
+import threading
+import queue
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Callable
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Callable
 
 # ================================================================
 # 2. Third-Party Imports
 # ================================================================
 import requests
 import pandas as pd
-from PIL import Image  # retained in case of future image handling
 from slugify import slugify
 from core.clients.musicbrainz import MusicBrainzClient
 from core.clients.discogs import DiscogsClient as CoreDiscogsClient
@@ -125,6 +130,14 @@ from core.clients.shopify import ShopifyClient
 from core.exporters.shopify_api_exporter import ShopifyAPIExporter
 from core.models import ShopifyDraft, ReleaseMatch, RecordInput
 
+# Optional: the Rust-based calamine reader loads Excel sheets much faster
+# and with less memory than openpyxl's full-workbook parse.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE: Optional[str] = "calamine"
+except Exception:
+    EXCEL_ENGINE = None
+
 # ================================================================
 # 3. Local Project Imports
 # ================================================================
@@ -147,6 +160,7 @@ OUTPUT_DIR_NAME = "output"
 LOGS_DIR_NAME = "logs"
 CACHE_DIR_NAME = "cache"
 PROCESSED_DIR_NAME = "processed"
+DISCOGS_ETAG_CACHE_NAME = "discogs_etag_cache.sqlite"
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -166,8 +180,53 @@ HANDLE_SUFFIX = (
     os.getenv("HANDLE_SUFFIX", (dt.date.today().strftime("%Y%m%d") + "a")).strip()
 )
 
-MIN_PRICE = 2.50  # USD minimum
-PRICE_STEP = 0.25  # round to nearest quarter
+# Number of rows whose OCR/MusicBrainz/Discogs lookups run concurrently so
+# their network round-trips overlap. Pacing is left to the clients: Discogs
+# requests share discogs_client's token bucket (plus 429 backoff) and
+# MusicBrainzClient holds its 1 req/sec, so workers never sleep on their own.
+LOOKUP_WORKERS = 4
+
+# Rows submitted to the lookup pool ahead of the row being emitted. Bounds how
+# many row dicts and Discogs payloads are alive at once on large sheets.
+LOOKUP_IN_FLIGHT = 4 * LOOKUP_WORKERS
+
+# Rows whose Discogs details fetch failed transiently are looked up again
+# this many seconds later, alongside the rest of the first pass.
+RETRY_DELAY_SECONDS = 2.0
+
+# Input rows are turned into dicts in slices of this many, on demand.
+INPUT_CHUNK_ROWS = 256
+
+# How often (ms) the GUI log window appends the log lines queued since the
+# last refresh.
+LOG_WINDOW_FLUSH_MS = 100
+
+# Most queued log lines appended per refresh; a burst larger than this is
+# spread over the following refreshes so one insert never stalls the GUI.
+LOG_WINDOW_MAX_LINES_PER_FLUSH = 500
+
+# Lines kept in the log window. Older lines are trimmed so a long run does
+# not slow every insert down (the full log is still in the log file).
+LOG_WINDOW_MAX_LINES = 5000
+
+# How often (ms) the GUI checks a running job for progress and completion.
+PROGRESS_POLL_MS = 50
+
+# Output CSVs are written through a 1 MiB buffer so rows reach disk in a few
+# large writes instead of one write per row.
+CSV_WRITE_BUFFER_BYTES = 1 << 20
+
+# Flush streamed output CSVs every N matched records so an interrupted run
+# still leaves usable partial files on disk.
+CSV_FLUSH_EVERY_RECORDS = 25
+
+# Pending row batches per streamed CSV before the emitting thread waits on
+# its writer thread.
+CSV_WRITE_QUEUE_SIZE = 64
+
+# Rows a streamed CSV collects before handing them to its writer thread as
+# one writerows() batch (periodic flushes hand over whatever is pending).
+CSV_WRITE_BATCH_ROWS = 500
 
 # Column names expected in the input sheet
 COL_ARTIST = "Artist"
@@ -193,6 +252,121 @@ DESCRIPTION_FOOTER_HTML = (
     "representing each album and providing thorough information so you can "
     "buy with confidence.</p>"
 )
+# Static tail of every description (spacer line + footer), joined once.
+DESCRIPTION_TAIL_HTML = "<br>\n" + DESCRIPTION_FOOTER_HTML
+
+# OCR / label diagnostics copied verbatim from the input row
+OCR_ROW_COLUMNS: Tuple[str, ...] = (
+    "Ocr_Catalog",
+    "Ocr_Matrix",
+    "Ocr_Label",
+    "Ocr_Year",
+    "Ocr_StereoMono",
+    "Ocr_Format_Flags",
+    "Ocr_Tracks",
+    "Ocr_Notes",
+    "Ocr_Scan_Confidence",
+    "Label_Catalog_Number",
+)
+
+# Columns of a Shopify product row, in the order make_shopify_rows_for_record
+# fills them. The products CSV writes them sorted, as it always has.
+SHOPIFY_PRODUCT_COLUMNS: Tuple[str, ...] = (
+    "Handle",
+    "Title",
+    "Description",
+    "Vendor",
+    "Product category",
+    "Type",
+    "Tags",
+    "Published",
+    "Status",
+    "Option1 Name",
+    "Option1 Value",
+    "Option2 Name",
+    "Option2 Value",
+    "Option3 Name",
+    "Option3 Value",
+    "Variant Price",
+    "Variant Compare At Price",
+    "Cost per item",
+    "Variant SKU",
+    "Variant Barcode",
+    "Variant Inventory Tracker",
+    "Variant Inventory Policy",
+    "Variant Inventory Qty",
+    "Variant Fulfillment Service",
+    "Variant Requires Shipping",
+    "Variant Taxable",
+    "Image Src",
+    "Image Position",
+    "Image Alt Text",
+    "SEO Title",
+    "SEO Description",
+    "Pricing Strategy Used",
+    "Pricing Notes",
+    "Variant Weight Unit",
+    "Variant Weight",
+    "product.metafields.custom.shop_signage",
+    "product.metafields.custom.album_cover_condtion",
+    "product.metafields.custom.album_condition",
+    "product.metafields.custom.condition",
+    "product.metafields.custom.condition_description",
+    "product.metafields.custom.uses_stock_photo",
+    "product.metafields.custom.shop_artist",
+    "product.metafields.custom.inventory_date",
+    "product.metafields.custom.discogs_release_id",
+    "Label_Misprint_Suspected",
+    "Label_Misprint_Reasons",
+) + OCR_ROW_COLUMNS
+
+# Header order of the products CSV
+SHOPIFY_PRODUCT_CSV_COLUMNS: Tuple[str, ...] = tuple(sorted(SHOPIFY_PRODUCT_COLUMNS))
+
+# Columns of the metafields-only CSV
+METAFIELD_COLUMNS: Tuple[str, ...] = (
+    "Handle",
+    "product.metafields.custom.shop_signage",
+    "product.metafields.custom.album_cover_condtion",
+    "product.metafields.custom.album_condition",
+    "product.metafields.custom.condition",
+    "product.metafields.custom.condition_description",
+    "product.metafields.custom.uses_stock_photo",
+    "product.metafields.custom.shop_artist",
+    "product.metafields.custom.inventory_date",
+    "product.metafields.custom.discogs_release_id",
+)
+
+# Columns the unmatched CSV adds to the input sheet's own columns
+UNMATCHED_EXTRA_COLUMNS: Tuple[str, ...] = (
+    "Reason",
+    "Discogs_Query_Used",
+    "Catalog_Used_Sheet",
+    "Catalog_Used_OCR",
+    "Handle",
+) + OCR_ROW_COLUMNS
+
+# Product row with every static Shopify default prefilled; each record
+# copies it and assigns only its own fields.
+_ROW_TEMPLATE: Dict[str, Any] = dict.fromkeys(SHOPIFY_PRODUCT_COLUMNS, "")
+_ROW_TEMPLATE.update(
+    {
+        "Product category": SHOPIFY_PRODUCT_CATEGORY,
+        "Type": SHOPIFY_PRODUCT_TYPE,
+        "Published": SHOPIFY_PUBLISHED,
+        "Status": SHOPIFY_PRODUCT_STATUS,
+        "Option1 Name": SHOPIFY_OPTION1_NAME,
+        "Option1 Value": SHOPIFY_OPTION1_VALUE,
+        "Variant Inventory Tracker": "shopify",
+        "Variant Inventory Policy": "deny",
+        "Variant Inventory Qty": 1,
+        "Variant Fulfillment Service": SHOPIFY_VARIANT_FULFILLMENT_SERVICE,
+        "Variant Requires Shipping": SHOPIFY_VARIANT_REQUIRES_SHIPPING,
+        "Variant Taxable": SHOPIFY_VARIANT_TAXABLE,
+        "Image Position": 1,
+        "Variant Weight Unit": "lb",
+    }
+)
 
 # Shop signage categories (simplified mapping from genres/styles)
 SHOP_SIGNAGE_MAP: Dict[str, str] = {
@@ -225,26 +399,47 @@ SHOP_SIGNAGE_MAP: Dict[str, str] = {
 }
 
 
+# Lower-cased styles that keep a "religious" style out of the Religious bucket
+_RELIGIOUS_EXCLUDED_STYLES = frozenset({"gospel", "holiday"})
+
+
 def simple_shop_signage(genre: Optional[str], styles: List[str]) -> str:
     """
     Very simple logic to derive a shop signage bucket from Discogs genre/styles.
     """
-    # Styles override genre if they map directly
+    return _shop_signage_for(genre, tuple(styles))
+
+
+@lru_cache(maxsize=1024)
+def _shop_signage_for(genre: Optional[str], styles: Tuple[str, ...]) -> str:
+    # Genre/style combinations repeat across an inventory, so each distinct
+    # combination is resolved (and lower-cased) only once per process.
+
+    # Styles override genre if they map directly. The same pass records the
+    # flags for the religious fallback, so styles are walked only once.
+    has_religious = False
+    has_excluded = False
     for st in styles:
-        if st in SHOP_SIGNAGE_MAP:
-            return SHOP_SIGNAGE_MAP[st]
+        signage = SHOP_SIGNAGE_MAP.get(st)
+        if signage is not None:
+            return signage
+        st_lower = st.lower()
+        if st_lower == "religious":
+            has_religious = True
+        elif st_lower in _RELIGIOUS_EXCLUDED_STYLES:
+            has_excluded = True
 
     if genre in SHOP_SIGNAGE_MAP:
         return SHOP_SIGNAGE_MAP[genre]
 
     # Special logic: if style is religious but not gospel or holiday, mark as Religious
-    lower_styles = [s.lower() for s in styles]
-    if "religious" in lower_styles and "gospel" not in lower_styles and "holiday" not in lower_styles:
+    if has_religious and not has_excluded:
         return "Religious"
 
     return genre or "Misc"
 
 
+@lru_cache(maxsize=4096)
 def normalize_artist_the(name: str) -> str:
     """
     If the artist starts with 'The', move 'The' to the end:
@@ -259,16 +454,29 @@ def normalize_artist_the(name: str) -> str:
     return name_stripped
 
 
+# Per-row text cleanups, compiled once at import.
+_TRAILING_PAREN_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_TRAILING_NUMBER_PAREN_RE = re.compile(r"\s*\(\d+\)$")
+_PAREN_RE = re.compile(r"\s*\([^)]*\)")
+_LABEL_SUFFIX_RE = re.compile(r"\b(Records?|Corp|Co\.?|Inc\.?)\b", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9]")
+
+
 def strip_trailing_paren(name: str) -> str:
     """Remove trailing parenthetical disambiguators like '(2)' from artist names."""
     if not name:
         return ""
-    return re.sub(r"\s*\([^)]*\)\s*$", "", name).strip()
+    return _TRAILING_PAREN_RE.sub("", name).strip()
 
 
+@lru_cache(maxsize=4096)
 def slugify_handle(text: str) -> str:
     """
     Create a Shopify handle from text.
+
+    Memoized: duplicate pressings and the constant handle suffix would
+    otherwise run the full python-slugify pipeline again on every row.
     """
     if not text:
         return ""
@@ -281,7 +489,7 @@ def generate_sku(handle: str) -> str:
     Uses the first part of the handle and a short hash suffix for uniqueness.
     """
     import hashlib
-    cleaned = re.sub(r"[^A-Za-z0-9]", "", handle or "").upper()
+    cleaned = _NON_ALNUM_RE.sub("", handle or "").upper()
     prefix = cleaned[:6]
     h = hashlib.md5(handle.encode("utf-8")).hexdigest().upper()
     suffix = h[:4]
@@ -289,22 +497,17 @@ def generate_sku(handle: str) -> str:
     return sku
 
 
-def round_price(value: float) -> float:
-    """
-    Round to nearest quarter, with a hard floor at MIN_PRICE.
+def summarize_formats(release: Dict[str, Any]) -> Tuple[str, Optional[int]]:
     """
-    rounded = round(value / PRICE_STEP) * PRICE_STEP
-    if rounded < MIN_PRICE:
-        rounded = MIN_PRICE
-    return rounded
-
+    Walk a Discogs release's formats once and return
+    (human-readable format string, estimated weight in grams).
 
-def build_format_description(release: Dict[str, Any]) -> str:
-    """
-    Build a human-readable format string from a Discogs release JSON.
+    Weight is a basic heuristic: number of discs * 300g; None when the
+    release lists no formats.
     """
     formats = release.get("formats") or []
     parts: List[str] = []
+    total_discs = 0
     for f in formats:
         name = f.get("name", "")
         desc = f.get("descriptions") or []
@@ -312,7 +515,20 @@ def build_format_description(release: Dict[str, Any]) -> str:
             parts.append(name)
         if isinstance(desc, (list, tuple)):
             parts.extend(desc)
-    return ", ".join(parts)
+        try:
+            total_discs += int(f.get("qty"))
+        except (TypeError, ValueError):
+            total_discs += 1
+
+    grams = total_discs * 300 if total_discs > 0 else None
+    return ", ".join(parts), grams
+
+
+def build_format_description(release: Dict[str, Any]) -> str:
+    """
+    Build a human-readable format string from a Discogs release JSON.
+    """
+    return summarize_formats(release)[0]
 
 
 def build_tracklist_html(release: Dict[str, Any]) -> str:
@@ -322,16 +538,14 @@ def build_tracklist_html(release: Dict[str, Any]) -> str:
     tracks = release.get("tracklist") or []
     if not tracks:
         return ""
-    lines = ["<h3>Tracklist</h3>", "<ol>"]
-    for t in tracks:
-        title = t.get("title", "")
-        duration = t.get("duration", "")
-        if duration:
-            lines.append(f"<li>{title} ({duration})</li>")
-        else:
-            lines.append(f"<li>{title}</li>")
-    lines.append("</ol>")
-    return "\n".join(lines)
+    # Titles are escaped so '&' or '<' in a track name cannot break the markup.
+    items = "\n".join(
+        f"<li>{html.escape(t.get('title') or '', quote=False)} ({t['duration']})</li>"
+        if t.get("duration")
+        else f"<li>{html.escape(t.get('title') or '', quote=False)}</li>"
+        for t in tracks
+    )
+    return f"<h3>Tracklist</h3>\n<ol>\n{items}\n</ol>"
 
 
 def extract_genre_and_styles(release: Dict[str, Any]) -> Tuple[Optional[str], List[str]]:
@@ -374,23 +588,7 @@ def calculate_weight_grams_from_formats(release: Dict[str, Any]) -> Optional[int
     """
     Estimate record weight from format information.
     """
-    formats = release.get("formats") or []
-    if not formats:
-        return None
-
-    # Basic heuristic: number of LPs * 300g
-    total_discs = 0
-    for f in formats:
-        qty = f.get("qty")
-        try:
-            qty_int = int(qty)
-        except (TypeError, ValueError):
-            qty_int = 1
-        total_discs += qty_int
-
-    if total_discs <= 0:
-        return None
-    return total_discs * 300
+    return summarize_formats(release)[1]
 
 
 def grams_to_pounds(grams: Optional[int]) -> Optional[float]:
@@ -443,28 +641,50 @@ def build_tags(
     """
     Build a comma-separated list of Shopify tags, SEO-friendly.
     """
-    tags: List[str] = []
-    if year:
-        tags.append(str(year))
-    if label:
-        tags.append(label)
-    if genre:
-        tags.append(genre)
-        tags.append(f"{genre} Vinyl")
-    for s in styles:
-        tags.append(s)
-        tags.append(f"{s} Vinyl")
-    if format_desc:
-        tags.append("Vinyl")
-        tags.append(format_desc)
-    # Deduplicate, preserve order
-    seen = set()
-    final_tags = []
-    for t in tags:
-        if t and t not in seen:
-            seen.add(t)
-            final_tags.append(t)
-    return ", ".join(final_tags)
+    return _tags_for(genre, tuple(styles), year, label, format_desc)
+
+
+@lru_cache(maxsize=8192)
+def _tags_for(
+    genre: Optional[str],
+    styles: Tuple[str, ...],
+    year: Optional[int],
+    label: Optional[str],
+    format_desc: str,
+) -> str:
+    # Releases from one artist/label repeat the same genre, styles, year and
+    # format, so each distinct combination is joined only once per process.
+
+    def candidates():
+        yield str(year) if year else ""
+        yield label or ""
+        if genre:
+            yield genre
+            yield f"{genre} Vinyl"
+        for s in styles:
+            # A blank style would otherwise leave a bare " Vinyl" tag.
+            if s:
+                yield s
+                yield f"{s} Vinyl"
+        if format_desc:
+            yield "Vinyl"
+            yield format_desc
+
+    # Deduplicate, preserve order (dict keys keep first-seen order)
+    return ", ".join(t for t in dict.fromkeys(candidates()) if t)
+
+
+# Unicode punctuation -> ASCII, applied in one str.translate pass
+_PUNCT_TABLE = str.maketrans(
+    {
+        "\u2013": "-",  # en dash
+        "\u2014": "-",  # em dash
+        "\u2018": "'",  # left single quote
+        "\u2019": "'",  # right single quote
+        "\u201c": '"',  # left double quote
+        "\u201d": '"',  # right double quote
+    }
+)
 
 
 def normalize_ascii_punctuation(text: str) -> str:
@@ -474,14 +694,30 @@ def normalize_ascii_punctuation(text: str) -> str:
     """
     if not text:
         return text
-    return (
-        text.replace("\u2013", "-")  # en dash
-        .replace("\u2014", "-")  # em dash
-        .replace("\u2018", "'")  # left single quote
-        .replace("\u2019", "'")  # right single quote
-        .replace("\u201c", '"')  # left double quote
-        .replace("\u201d", '"')  # right double quote
-    )
+    return text.translate(_PUNCT_TABLE)
+
+
+# Shapes the strptime formats below can match (Y-m-d, m/d/Y, m/d/y)
+_INVENTORY_DATE_RE = re.compile(r"^\d{1,4}[-/]\d{1,2}[-/]\d{1,4}$")
+
+
+@lru_cache(maxsize=1024)
+def _parse_inventory_date_str(s: str) -> Optional[str]:
+    """
+    Parse a stripped date string to YYYY-MM-DD, or None if unparseable.
+    Cached because a sheet usually repeats the same few inventory dates.
+    """
+    if _INVENTORY_DATE_RE.match(s):
+        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
+            try:
+                return dt.datetime.strptime(s, fmt).date().isoformat()
+            except ValueError:
+                continue
+
+    try:
+        return dt.date.fromisoformat(s).isoformat()
+    except Exception:
+        return None
 
 
 def normalize_inventory_date(value: Any) -> str:
@@ -489,15 +725,13 @@ def normalize_inventory_date(value: Any) -> str:
     Normalize an inventory date to YYYY-MM-DD (Shopify date metafield).
     Fallback to today's date if missing or unparseable.
     """
-    today = dt.date.today().isoformat()
     if value is None:
-        return today
+        return dt.date.today().isoformat()
 
     try:
-        import pandas as _pd  # type: ignore
-        if _pd.isna(value):  # pragma: no cover
-            return today
-    except Exception:
+        if pd.isna(value):
+            return dt.date.today().isoformat()
+    except (TypeError, ValueError):
         pass
 
     if isinstance(value, dt.datetime):
@@ -506,19 +740,15 @@ def normalize_inventory_date(value: Any) -> str:
         return value.isoformat()
 
     s = str(value).strip()
-    if not s:
-        return today
+    parsed = _parse_inventory_date_str(s) if s else None
+    return parsed or dt.date.today().isoformat()
 
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
-        try:
-            return dt.datetime.strptime(s, fmt).date().isoformat()
-        except ValueError:
-            continue
 
-    try:
-        return dt.date.fromisoformat(s).isoformat()
-    except Exception:
-        return today
+# Band/ensemble markers that rule out a person's name (matched on upper case)
+_BAND_KEYWORDS_RE = re.compile(
+    r"&| AND |BAND|ORCHESTRA|PHILHARMONIC|SYMPHONY|ENSEMBLE|CHOIR|CHORUS"
+    r"|QUARTET|TRIO|DUO|COMPANY|PLAYERS|SINGERS"
+)
 
 
 def _looks_like_person(name: str) -> bool:
@@ -527,29 +757,9 @@ def _looks_like_person(name: str) -> bool:
     """
     if not name:
         return False
-    n_upper = name.upper()
-    band_keywords = [
-        "&",
-        " AND ",
-        "BAND",
-        "ORCHESTRA",
-        "PHILHARMONIC",
-        "SYMPHONY",
-        "ENSEMBLE",
-        "CHOIR",
-        "CHORUS",
-        "QUARTET",
-        "TRIO",
-        "DUO",
-        "COMPANY",
-        "PLAYERS",
-        "SINGERS",
-    ]
-    for kw in band_keywords:
-        if kw in n_upper:
-            return False
-    tokens = [t for t in name.strip().split() if t]
-    return 2 <= len(tokens) <= 4
+    if _BAND_KEYWORDS_RE.search(name.upper()):
+        return False
+    return 2 <= len(name.split()) <= 4
 
 
 def format_person_name(name: str) -> str:
@@ -574,9 +784,14 @@ def extract_composer(release_details: Dict[str, Any]) -> Optional[str]:
     """
     extras = release_details.get("extraartists") or []
     for ex in extras:
-        role = str(ex.get("role", "")).lower()
+        role = ex.get("role", "")
+        if not isinstance(role, str):
+            role = str(role)
+        if "composed" not in role.lower():
+            continue
+        # Only credits that are composers pay for stringifying the name.
         name = str(ex.get("name", "")).strip()
-        if "composed" in role and name:
+        if name:
             return name
     return None
 
@@ -589,102 +804,28 @@ def build_shop_artist(artist_name: str, release_details: Dict[str, Any]) -> str:
       - For bands/groups, leave as-is (but still normalized 'The X' later if desired).
     """
     artist_name = strip_trailing_paren(artist_name)
-    composer = extract_composer(release_details)
+    if _is_orchestral_artist(artist_name):
+        composer = extract_composer(release_details)
+        if composer:
+            return composer
+    return _shop_artist_from_name(artist_name)
+
+
+# The name-only parts of build_shop_artist are memoized: the same artists
+# recur across an inventory. Only the composer lookup depends on the release.
+@lru_cache(maxsize=4096)
+def _is_orchestral_artist(artist_name: str) -> bool:
     upper_artist = artist_name.upper()
-    orchestra_words = ["ORCHESTRA", "PHILHARMONIC", "SYMPHONY", "CONDUCTOR"]
+    return any(w in upper_artist for w in ("ORCHESTRA", "PHILHARMONIC", "SYMPHONY", "CONDUCTOR"))
 
-    if composer and any(w in upper_artist for w in orchestra_words):
-        return composer
 
+@lru_cache(maxsize=4096)
+def _shop_artist_from_name(artist_name: str) -> str:
     if _looks_like_person(artist_name):
         return format_person_name(artist_name)
-
     return artist_name.strip()
 
 
-def normalize_discogs_suggestion_key(key: str) -> Optional[str]:
-    """
-    Map Discogs price suggestion condition labels to our normalized ladder.
-    """
-    k = key.lower()
-    if "mint (m)" in k and "near" not in k:
-        return "M"
-    if "near mint" in k or "m-" in k:
-        return "NM"
-    if "vg+" in k or "very good plus" in k or "excellent" in k:
-        return "VG+"
-    if "very good" in k and "+" not in k:
-        return "VG"
-    if "good plus" in k or "g+" in k:
-        return "G+"
-    if k.startswith("good"):
-        return "G"
-    if "fair" in k or "poor" in k:
-        return "F/P"
-    return None
-
-
-def discogs_price_from_suggestions(
-    media_condition: str, suggestions: Dict[str, Any]
-) -> Optional[float]:
-    """
-    Pick a price suggestion based on media condition.
-
-    - Exact match: use that value.
-    - Otherwise: take the next lower condition (if present) minus 10%.
-    - If no lower condition is available: take the next higher condition minus 10%.
-    - Sleeve condition is ignored.
-    """
-    if not suggestions:
-        return None
-
-    norm_media = pricing.normalize_condition(media_condition)
-    if not norm_media:
-        return None
-
-    # Normalize suggestion keys to ladder values
-    norm_map: Dict[str, float] = {}
-    for key, obj in suggestions.items():
-        if not isinstance(obj, dict):
-            continue
-        norm_key = normalize_discogs_suggestion_key(str(key))
-        if not norm_key:
-            continue
-        try:
-            val = obj.get("value")
-            price_val = float(val) if val is not None else None
-        except (TypeError, ValueError):
-            price_val = None
-        if price_val is not None:
-            norm_map[norm_key] = price_val
-
-    if not norm_map:
-        return None
-
-    ladder = pricing.CONDITION_LADDER
-    if norm_media in norm_map:
-        return norm_map[norm_media]
-
-    # Search next lower condition first
-    try:
-        idx = ladder.index(norm_media)
-    except ValueError:
-        return None
-
-    for j in range(idx + 1, len(ladder)):
-        cond = ladder[j]
-        if cond in norm_map:
-            return norm_map[cond] * 0.9
-
-    # Then search next higher condition
-    for j in range(idx - 1, -1, -1):
-        cond = ladder[j]
-        if cond in norm_map:
-            return norm_map[cond] * 0.9
-
-    return None
-
-
 # ---------------------------------------------------------------------------
 # Discogs API helpers (wrappers around discogs_client)
 # ---------------------------------------------------------------------------
@@ -707,9 +848,9 @@ def _normalize_label_for_mb(label: Optional[str]) -> Optional[str]:
     if not label:
         return None
     lbl = str(label)
-    lbl = re.sub(r"\s*\([^)]*\)", "", lbl)  # remove parentheticals
-    lbl = re.sub(r"\b(Records?|Corp|Co\.?|Inc\.?)\b", "", lbl, flags=re.IGNORECASE)
-    lbl = re.sub(r"\s+", " ", lbl).strip()
+    lbl = _PAREN_RE.sub("", lbl)  # remove parentheticals
+    lbl = _LABEL_SUFFIX_RE.sub("", lbl)
+    lbl = _WHITESPACE_RE.sub(" ", lbl).strip()
     return lbl or None
 
 
@@ -720,23 +861,8 @@ def _normalize_artist_for_mb(artist: str) -> str:
     """
     if not artist:
         return ""
-    a = re.sub(r"\s*\([^)]*\)", "", str(artist))
-    return re.sub(r"\s+", " ", a).strip()
-
-
-def rate_limit_sleep(resp: requests.Response) -> None:
-    """
-    Respect Discogs rate limits by sleeping if X-Discogs-Ratelimit-Remaining is low.
-    """
-    remaining = resp.headers.get("X-Discogs-Ratelimit-Remaining")
-    if remaining is None:
-        return
-    try:
-        rem_int = int(remaining)
-    except ValueError:
-        return
-    if rem_int < 5:
-        time.sleep(1.0)
+    a = _PAREN_RE.sub("", str(artist))
+    return _WHITESPACE_RE.sub(" ", a).strip()
 
 
 def discogs_search_release(
@@ -761,11 +887,14 @@ def discogs_search_release(
     )
 
 
-def discogs_get_release_details(token: str, release_id: int) -> Optional[Dict[str, Any]]:
+def discogs_get_release_details(
+    token: str, release_id: int
+) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
     """
-    Fetch full release details for a given Discogs release ID.
+    Fetch full release details for a given Discogs release ID, together with
+    the HTTP status Discogs answered with (None when no answer came back).
     """
-    return discogs_client.get_release_details(token, release_id)
+    return discogs_client.get_release_details_with_status(token, release_id)
 
 
 def discogs_get_marketplace_stats(
@@ -777,6 +906,12 @@ def discogs_get_marketplace_stats(
     return discogs_client.get_marketplace_stats(token, release_id)
 
 
+# Catalog-number year check: strip spaces/hyphens, then test for a bare year
+_CATALOG_STRIP_RE = re.compile(r"[\s-]")
+_CATALOG_YEAR_RE = re.compile(r"(19[0-9]{2}|20[0-2][0-9])")
+
+# A release year embedded in free text (e.g. "circa 1972 reissue")
+_YEAR_RE = re.compile(r"\b(19[0-9]{2}|20[0-2][0-9])\b")
 
 
 def sanitize_catalog_for_search(cat: Optional[str]) -> Optional[str]:
@@ -789,8 +924,8 @@ def sanitize_catalog_for_search(cat: Optional[str]) -> Optional[str]:
         return None
     s = str(cat).strip()
     # Collapse spaces/hyphens just for the year check
-    compact = re.sub(r"[\s-]", "", s)
-    if re.fullmatch(r"(19[0-9]{2}|20[0-2][0-9])", compact):
+    compact = _CATALOG_STRIP_RE.sub("", s)
+    if _CATALOG_YEAR_RE.fullmatch(compact):
         return None
     return s or None
 
@@ -850,9 +985,11 @@ def ensure_base_dirs(base_dir: Path) -> Dict[str, Path]:
     }
 
 
+@lru_cache(maxsize=1)
 def get_settings_path() -> Path:
     """
     Return the JSON settings file path located under the user's home directory.
+    Resolved (and its folder created) once per process.
     """
     home = Path.home()
     base = home / ".discogs_to_shopify"
@@ -860,7 +997,13 @@ def get_settings_path() -> Path:
     return base / "discogs_to_shopify_settings.json"
 
 
-def load_settings() -> Dict[str, Any]:
+# Settings as last read from or written to disk. load_settings hands out
+# copies, so callers can edit theirs freely until they save it.
+_settings_cache: Optional[Dict[str, Any]] = None
+_settings_lock = threading.Lock()
+
+
+def _read_settings_file() -> Dict[str, Any]:
     path = get_settings_path()
     if not path.exists():
         return {}
@@ -874,16 +1017,40 @@ def load_settings() -> Dict[str, Any]:
     return data
 
 
+def load_settings() -> Dict[str, Any]:
+    """
+    Return a copy of the saved settings; the file is only parsed once.
+    """
+    global _settings_cache
+    with _settings_lock:
+        if _settings_cache is None:
+            _settings_cache = _read_settings_file()
+        return dict(_settings_cache)
+
+
 def save_settings(settings: Dict[str, Any]) -> None:
-    path = get_settings_path()
-    try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
-    except Exception as e:
+    """
+    Write settings to disk and remember them for later loads. Settings that
+    match what is already saved are not rewritten. The file is replaced in
+    one step (temp file + rename, no fsync), so a crash mid-save leaves the
+    previous settings intact.
+    """
+    global _settings_cache
+    with _settings_lock:
+        if settings == _settings_cache:
+            return
+        path = get_settings_path()
+        tmp_path = path.with_name(path.name + ".tmp")
         try:
-            logger.warning("Failed to save settings: %s", e)
-        except NameError:
-            print(f"Failed to save settings: {e}")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(settings, f, indent=2)
+            os.replace(tmp_path, path)
+            _settings_cache = dict(settings)
+        except Exception as e:
+            try:
+                logger.warning("Failed to save settings: %s", e)
+            except NameError:
+                print(f"Failed to save settings: {e}")
 
 
 # ---------------------------------------------------------------------------
@@ -898,6 +1065,7 @@ DISCOGS_USER_AGENT = (
 _boot_settings = load_settings()
 BASE_DIR = Path(_boot_settings.get("base_dir", str(DEFAULT_BASE_DIR))).expanduser()
 DIRS = ensure_base_dirs(BASE_DIR)
+discogs_client.set_etag_cache_path(DIRS["cache"] / DISCOGS_ETAG_CACHE_NAME)
 _boot_settings["base_dir"] = str(BASE_DIR)
 save_settings(_boot_settings)
 
@@ -932,21 +1100,46 @@ def persist_discogs_token_to_env(token: str) -> None:
         except Exception as e:
             logger.warning("Failed to persist Discogs token with setx: %s", e)
 
-def clean_price(value):
-    if value is None:
-        return None
-    if isinstance(value, (int, float)):
-        return float(value)
-    s = str(value).strip().replace("$", "").replace(",", "")
-    try:
-        return float(s)
-    except:
-        return None
-  
+# Currency symbol and thousands separators dropped from Reference Price cells.
+_PRICE_STRIP = str.maketrans("", "", "$,")
+
+
+def parse_year_column(values: pd.Series) -> List[Optional[int]]:
+    """
+    Parse the Year column in one pass: a cell's first four characters as a
+    number, else the first plausible year anywhere in its text. Blank,
+    zero and unparseable cells come back as None.
+    """
+    text = values.astype(str)
+    head = text.str[:4]
+    leading = pd.to_numeric(
+        head.where(head.str.fullmatch(r"\s*[+-]?\d+\s*", na=False)), errors="coerce"
+    )
+    embedded = pd.to_numeric(text.str.extract(_YEAR_RE, expand=False), errors="coerce")
+    years = leading.fillna(embedded)
+    years = years.where(years != 0)
+    return [None if y != y else int(y) for y in years.tolist()]
+
+
+def parse_price_column(values: pd.Series) -> List[Optional[float]]:
+    """
+    Parse a Reference Price column: strip '$' and thousands separators and
+    coerce to float in one pass. Blank or unparseable cells come back as None.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        prices = pd.to_numeric(values, errors="coerce")
+    else:
+        text = values.astype(str).str.strip().str.translate(_PRICE_STRIP)
+        prices = pd.to_numeric(text, errors="coerce")
+    return prices.astype(object).where(prices.notna(), None).tolist()
+
 # ---------------------------------------------------------------------------
 # Row processing
 # ---------------------------------------------------------------------------
 
+# Sleeve grades bad enough that the label photo should lead the listing.
+_POOR_SLEEVE_RE = re.compile(r"POOR|FAIR|F/P|\(P\)|\(F\)", re.IGNORECASE)
+
 
 def make_shopify_rows_for_record(
     input_row: Dict[str, Any],
@@ -955,38 +1148,31 @@ def make_shopify_rows_for_record(
     misprint_info: Optional[Dict[str, Any]],
     handle_registry: Dict[str, int],
     match: Optional[ReleaseMatch] = None,
+    reference_price: Optional[float] = None,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], float, Optional[float]]:
     """
     Build one or more Shopify rows (main product + optional image-only row)
     for a single matched Discogs release.
 
+    `input_row` comes from normalize_input_frame, so its text columns are
+    already stripped strings; `reference_price` is the row's Reference
+    Price as parsed by parse_price_column.
+
     Returns:
         (shopify_rows, metafield_row)
     """
 
-    artist_raw = str(input_row.get(COL_ARTIST, "")).strip()
-    artist_clean = strip_trailing_paren(artist_raw)
-    title = str(input_row.get(COL_TITLE, "")).strip()
-
-    # Reference price may come in as float/NaN from pandas; normalize to clean string
-    raw_price = input_row.get(COL_PRICE, "")
-    try:
-        if raw_price is None or (isinstance(raw_price, float) and pd.isna(raw_price)):
-            price_str = ""
-        else:
-            price_str = str(raw_price).strip()
-    except Exception:
-        price_str = ""
-
-    media_cond = str(input_row.get(COL_MEDIA_COND, "")).strip()
-    sleeve_cond = str(input_row.get(COL_SLEEVE_COND, "")).strip()
-    center_label_photo = str(input_row.get(COL_CENTER_LABEL_PHOTO, "")).strip()
+    artist_clean = strip_trailing_paren(input_row.get(COL_ARTIST, ""))
+    title = input_row.get(COL_TITLE, "")
+    media_cond = input_row.get(COL_MEDIA_COND, "")
+    sleeve_cond = input_row.get(COL_SLEEVE_COND, "")
+    center_label_photo = input_row.get(COL_CENTER_LABEL_PHOTO, "")
 
     artist_display = normalize_artist_the(artist_clean)
 
     label, year = extract_label_and_year(release_details)
     genre, styles = extract_genre_and_styles(release_details)
-    format_desc = build_format_description(release_details)
+    format_desc, grams = summarize_formats(release_details)
     tracklist_html = build_tracklist_html(release_details)
     shop_signage = simple_shop_signage(genre, styles)
     inventory_date = normalize_inventory_date(
@@ -1002,20 +1188,24 @@ def make_shopify_rows_for_record(
 
     # --- Weight
     # --- Barcode / SKU ---
-    discogs_barcode: Optional[str] = None
-    for ident in release_details.get("identifiers") or []:
-        id_type = str(ident.get("type", "")).strip().lower()
-        if id_type == "barcode":
-            val = str(ident.get("value", "")).strip()
-            if val:
-                discogs_barcode = val
-                break
+    # First non-blank barcode; only barcode identifiers have their value read.
+    discogs_barcode: Optional[str] = next(
+        (
+            val
+            for val in (
+                str(ident.get("value", "")).strip()
+                for ident in release_details.get("identifiers") or ()
+                if str(ident.get("type", "")).strip().lower() == "barcode"
+            )
+            if val
+        ),
+        None,
+    )
 
     # Autogenerate SKU from handle (10-char alphanumeric); do not use barcode
     # SKU will be set after handle is computed below.
 
-    # Weight estimation
-    grams = calculate_weight_grams_from_formats(release_details)
+    # Weight estimation (grams comes from the same formats walk as format_desc)
     pounds = grams_to_pounds(grams)
 
     full_title = make_full_release_title(artist_display, title, label, year)
@@ -1058,26 +1248,24 @@ def make_shopify_rows_for_record(
     ctx = pricing.pricing_context_from_match(
         match=match_for_pricing,
         media_condition=media_cond,
-        reference_price=clean_price(price_str),
-        format_type=format_desc or (str(input_row.get(COL_TYPE, "")).strip() or "LP"),
+        reference_price=reference_price,
+        format_type=format_desc or input_row.get(COL_TYPE, "") or "LP",
     )
 
     # Compute price using the pricing engine
     pricing_result = pricing.compute_price(ctx)
     price = pricing_result.final_price
     price_str_out = f"{price:.2f}"
-    ref_price_val = clean_price(price_str)
+    ref_price_val = reference_price
 
     # Unique handle
     base_handle = slugify_handle(f"{artist_display} {title} {year}".strip())
     if HANDLE_SUFFIX:
         base_handle = f"{base_handle}-{slugify_handle(HANDLE_SUFFIX)}"
-    if base_handle not in handle_registry:
-        handle_registry[base_handle] = 1
-        handle = base_handle
-    else:
-        handle_registry[base_handle] += 1
-        handle = f"{base_handle}-{handle_registry[base_handle]}"
+    # One get + one store per row; only collisions pay for the suffix.
+    seen = handle_registry.get(base_handle, 0) + 1
+    handle_registry[base_handle] = seen
+    handle = base_handle if seen == 1 else f"{base_handle}-{seen}"
 
     # Autogenerated SKU (10-char alphanumeric)
     sku = generate_sku(handle)
@@ -1092,10 +1280,7 @@ def make_shopify_rows_for_record(
         discogs_cover_url = extract_primary_image_url(release_search_obj or {})
 
     # Sleeve in poor/fair condition? Prefer the label photo as primary to avoid a pristine stock image.
-    sleeve_upper = sleeve_cond.upper()
-    sleeve_is_poor = any(
-        token in sleeve_upper for token in ["POOR", "FAIR", "F/P", "(P)", "(F)"]
-    )
+    sleeve_is_poor = bool(_POOR_SLEEVE_RE.search(sleeve_cond))
 
     primary_image_url = discogs_cover_url
     additional_images: List[str] = []
@@ -1127,34 +1312,30 @@ def make_shopify_rows_for_record(
     # -------------------------
     # Description (Body HTML)
     # -------------------------
-    body_lines: List[str] = []
-    body_lines.append(f"<b>Artist:</b> {artist_display}<br>")
-    body_lines.append(f"<b>Album Title:</b> {title}<br>")
-    if label:
-        body_lines.append(f"<b>Label:</b> {label}<br>")
-    if year:
-        body_lines.append(f"<b>Year:</b> {year}<br>")
-    if format_desc:
-        body_lines.append(f"<b>Format:</b> {format_desc}<br>")
-    if genre:
-        body_lines.append(f"<b>Genre:</b> {genre}<br>")
-    if media_cond:
-        body_lines.append(f"<b>Media Condition:</b> {media_cond}<br>")
-    if sleeve_cond:
-        body_lines.append(f"<b>Sleeve Condition:</b> {sleeve_cond}<br>")
-    if discogs_url:
-        body_lines.append(
-            f'<b>Discogs Link:</b> <a href="{discogs_url}" target="_blank">{discogs_url}</a><br>'
+    # Blank optional lines are dropped; the prebuilt static tail always
+    # closes the body, so only the per-record lines are joined here.
+    body_lines = "\n".join(
+        filter(
+            None,
+            (
+                f"<b>Artist:</b> {artist_display}<br>",
+                f"<b>Album Title:</b> {title}<br>",
+                f"<b>Label:</b> {label}<br>" if label else "",
+                f"<b>Year:</b> {year}<br>" if year else "",
+                f"<b>Format:</b> {format_desc}<br>" if format_desc else "",
+                f"<b>Genre:</b> {genre}<br>" if genre else "",
+                f"<b>Media Condition:</b> {media_cond}<br>" if media_cond else "",
+                f"<b>Sleeve Condition:</b> {sleeve_cond}<br>" if sleeve_cond else "",
+                (
+                    f'<b>Discogs Link:</b> <a href="{discogs_url}" target="_blank">{discogs_url}</a><br>'
+                    if discogs_url
+                    else ""
+                ),
+                f"<br>\n{tracklist_html}" if tracklist_html else "",
+            ),
         )
-    if tracklist_html:
-        body_lines.append("<br>")
-        body_lines.append(tracklist_html)
-
-    # Footer
-    body_lines.append("<br>")
-    body_lines.append(DESCRIPTION_FOOTER_HTML)
-
-    body_html = "\n".join(body_lines)
+    )
+    body_html = f"{body_lines}\n{DESCRIPTION_TAIL_HTML}"
 
     # -------------------------
     # Metafield values
@@ -1166,103 +1347,66 @@ def make_shopify_rows_for_record(
     condition_summary = "Used"
 
     condition_description_value = (
-        str(input_row.get("Condition Description", "") or "").strip()
-        or str(input_row.get("Notes", "") or "").strip()
+        input_row.get("Condition Description", "")
+        or input_row.get("Notes", "")
     )
 
     # -------------------------
     # Main product row
     # -------------------------
-    row: Dict[str, Any] = {
-        "Handle": handle,
-        "Title": full_title,
-        "Description": body_html,
-        "Vendor": label,
-        "Product category": SHOPIFY_PRODUCT_CATEGORY,
-        "Type": SHOPIFY_PRODUCT_TYPE,
-        "Tags": tags,
-        "Published": SHOPIFY_PUBLISHED,
-        "Status": SHOPIFY_PRODUCT_STATUS,
-        "Option1 Name": SHOPIFY_OPTION1_NAME,
-        "Option1 Value": SHOPIFY_OPTION1_VALUE,
-        "Option2 Name": "",
-        "Option2 Value": "",
-        "Option3 Name": "",
-        "Option3 Value": "",
-        "Variant Price": price_str_out,
-        "Variant Compare At Price": "",
-        "Cost per item": "",
-        "Variant SKU": sku,
-        "Variant Barcode": discogs_barcode or "",
-        "Variant Inventory Tracker": "shopify",
-        "Variant Inventory Policy": "deny",
-        "Variant Inventory Qty": 1,
-        "Variant Fulfillment Service": SHOPIFY_VARIANT_FULFILLMENT_SERVICE,
-        "Variant Requires Shipping": SHOPIFY_VARIANT_REQUIRES_SHIPPING,
-        "Variant Taxable": SHOPIFY_VARIANT_TAXABLE,
-        "Image Src": primary_image_url,
-        "Image Position": 1,
-        "Image Alt Text": full_title,
-        "SEO Title": seo_title,
-        "SEO Description": seo_description,
-        "Pricing Strategy Used": pricing_result.strategy_code,
-        "Pricing Notes": pricing_result.notes,
-        "Variant Weight Unit": "lb",
-        "Variant Weight": pounds if pounds is not None else "",
-        # Product metafields (full product CSV)
-        "product.metafields.custom.shop_signage": shop_signage,
-        "product.metafields.custom.album_cover_condtion": album_cover_condtion_value,
-        "product.metafields.custom.album_condition": album_condition_value,
-        "product.metafields.custom.condition": condition_summary,
-        "product.metafields.custom.condition_description": condition_description_value,
-        "product.metafields.custom.uses_stock_photo": uses_stock_photo_value,
-        "product.metafields.custom.shop_artist": shop_artist,
-        "product.metafields.custom.inventory_date": inventory_date,
-        "product.metafields.custom.discogs_release_id": str(discogs_release_id or ""),
-        # Misprint diagnostics
-        "Label_Misprint_Suspected": "TRUE" if mis_suspected else "FALSE",
-        "Label_Misprint_Reasons": mis_reasons,
-        # OCR / label diagnostics
-        "Ocr_Catalog": input_row.get("Ocr_Catalog", ""),
-        "Ocr_Matrix": input_row.get("Ocr_Matrix", ""),
-        "Ocr_Label": input_row.get("Ocr_Label", ""),
-        "Ocr_Year": input_row.get("Ocr_Year", ""),
-        "Ocr_StereoMono": input_row.get("Ocr_StereoMono", ""),
-        "Ocr_Format_Flags": input_row.get("Ocr_Format_Flags", ""),
-        "Ocr_Tracks": input_row.get("Ocr_Tracks", ""),
-        "Ocr_Notes": input_row.get("Ocr_Notes", ""),
-        "Ocr_Scan_Confidence": input_row.get("Ocr_Scan_Confidence", ""),
-        "Label_Catalog_Number": input_row.get("Label_Catalog_Number", ""),
-    }
+    row: Dict[str, Any] = _ROW_TEMPLATE.copy()
+    row["Handle"] = handle
+    row["Title"] = full_title
+    row["Description"] = body_html
+    row["Vendor"] = label
+    row["Tags"] = tags
+    row["Variant Price"] = price_str_out
+    row["Variant SKU"] = sku
+    row["Variant Barcode"] = discogs_barcode or ""
+    row["Image Src"] = primary_image_url
+    row["Image Alt Text"] = full_title
+    row["SEO Title"] = seo_title
+    row["SEO Description"] = seo_description
+    row["Pricing Strategy Used"] = pricing_result.strategy_code
+    row["Pricing Notes"] = pricing_result.notes
+    row["Variant Weight"] = pounds if pounds is not None else ""
+    # Product metafields (full product CSV)
+    row["product.metafields.custom.shop_signage"] = shop_signage
+    row["product.metafields.custom.album_cover_condtion"] = album_cover_condtion_value
+    row["product.metafields.custom.album_condition"] = album_condition_value
+    row["product.metafields.custom.condition"] = condition_summary
+    row["product.metafields.custom.condition_description"] = condition_description_value
+    row["product.metafields.custom.uses_stock_photo"] = uses_stock_photo_value
+    row["product.metafields.custom.shop_artist"] = shop_artist
+    row["product.metafields.custom.inventory_date"] = inventory_date
+    row["product.metafields.custom.discogs_release_id"] = str(discogs_release_id or "")
+    # Misprint diagnostics
+    row["Label_Misprint_Suspected"] = "TRUE" if mis_suspected else "FALSE"
+    row["Label_Misprint_Reasons"] = mis_reasons
+    # OCR / label diagnostics
+    for key in OCR_ROW_COLUMNS:
+        row[key] = input_row.get(key, "")
 
     rows: List[Dict[str, Any]] = [row]
 
-    # Additional image rows
+    # Additional image rows: Shopify only reads the handle and image fields on
+    # these; the CSV writer fills every other column with "".
     pos = 2
     for img in additional_images:
         if not img:
             continue
-        img_row = {k: "" for k in row.keys()}
-        img_row["Handle"] = handle
-        img_row["Image Src"] = img
-        img_row["Image Position"] = pos
-        img_row["Image Alt Text"] = full_title
-        rows.append(img_row)
+        rows.append(
+            {
+                "Handle": handle,
+                "Image Src": img,
+                "Image Position": pos,
+                "Image Alt Text": full_title,
+            }
+        )
         pos += 1
 
-    # Metafield-only row for the metafields CSV
-    metafield_row: Dict[str, Any] = {
-        "Handle": handle,
-        "product.metafields.custom.shop_signage": shop_signage,
-        "product.metafields.custom.album_cover_condtion": album_cover_condtion_value,
-        "product.metafields.custom.album_condition": album_condition_value,
-        "product.metafields.custom.condition": condition_summary,
-        "product.metafields.custom.condition_description": condition_description_value,
-        "product.metafields.custom.uses_stock_photo": uses_stock_photo_value,
-        "product.metafields.custom.shop_artist": shop_artist,
-        "product.metafields.custom.inventory_date": inventory_date,
-        "product.metafields.custom.discogs_release_id": str(discogs_release_id or ""),
-    }
+    # Metafield-only row for the metafields CSV (same values as the product row)
+    metafield_row: Dict[str, Any] = {key: row[key] for key in METAFIELD_COLUMNS}
 
     return rows, metafield_row, price, ref_price_val
 
@@ -1275,14 +1419,14 @@ def row_to_shopify_draft(
     Convert the primary product row dict into a ShopifyDraft for API export.
     Note: only uses HTTP(S) image URLs; local file paths are ignored to avoid storage issues.
     """
-    tags_str = str(row.get("Tags", "") or "")
+    tags_str = cell_text(row, "Tags")
     tags = [t.strip() for t in tags_str.split(",") if t.strip()]
 
     images: List[str] = []
     if image_urls is not None:
         images = [u for u in image_urls if u]
     else:
-        img_src = str(row.get("Image Src", "") or "").strip()
+        img_src = cell_text(row, "Image Src")
         if img_src.lower().startswith(("http://", "https://")):
             images.append(img_src)
 
@@ -1304,8 +1448,7 @@ def row_to_shopify_draft(
             val = str(row[k])
             # Clean shop_artist: drop trailing "(number)" tokens like "(5)"
             if short_key == "shop_artist":
-                import re as _re  # local import to avoid top-level change
-                val = _re.sub(r"\s*\(\d+\)$", "", val).strip()
+                val = _TRAILING_NUMBER_PAREN_RE.sub("", val).strip()
             metafields[short_key] = val
 
     try:
@@ -1314,22 +1457,236 @@ def row_to_shopify_draft(
         price_val = 0.0
 
     return ShopifyDraft(
-        handle=str(row.get("Handle", "") or "").strip(),
-        title=str(row.get("Title", "") or "").strip(),
-        body_html=str(row.get("Description", "") or "").strip(),
-        vendor=str(row.get("Vendor", "") or "").strip(),
-        product_type=str(row.get("Type", "") or "").strip(),
-        product_category=str(row.get("Product category", "") or "").strip(),
+        handle=cell_text(row, "Handle"),
+        title=cell_text(row, "Title"),
+        body_html=cell_text(row, "Description"),
+        vendor=cell_text(row, "Vendor"),
+        product_type=cell_text(row, "Type"),
+        product_category=cell_text(row, "Product category"),
         tags=tags,
         price=price_val,
         metafields=metafields,
         images=images,
         collections=[],
-        sku=str(row.get("Variant SKU", "") or "").strip(),
-        barcode=str(row.get("Variant Barcode", "") or "").strip(),
+        sku=cell_text(row, "Variant SKU"),
+        barcode=cell_text(row, "Variant Barcode"),
     )
 
 
+# ---------------------------------------------------------------------------
+# Input / CSV output helpers
+# ---------------------------------------------------------------------------
+
+
+# Text columns cleaned up front so per-row code sees plain stripped strings
+# instead of NaN floats or padded cells.
+INPUT_TEXT_COLUMNS = (
+    COL_ARTIST,
+    COL_TITLE,
+    COL_COUNTRY,
+    COL_CATALOG,
+    "Label",
+    COL_TYPE,
+    COL_MEDIA_COND,
+    COL_SLEEVE_COND,
+    COL_CENTER_LABEL_PHOTO,
+    COL_MUSICBRAINZ_ALBUMID,
+    COL_MUSICBRAINZ_RELEASEGROUPID,
+    "Condition Description",
+    "Notes",
+    "Variant Barcode",
+)
+
+# Low-cardinality text columns (a few condition grades, formats and
+# countries repeated on every row) held as categoricals, so the sheet keeps
+# one copy of each distinct value plus small integer codes.
+INPUT_CATEGORY_COLUMNS = (
+    COL_MEDIA_COND,
+    COL_SLEEVE_COND,
+    COL_TYPE,
+    COL_COUNTRY,
+)
+
+
+def read_input(input_path: Path) -> pd.DataFrame:
+    """
+    Load the inventory sheet (CSV or Excel) into a DataFrame.
+
+    The text columns are read as strings rather than type-inferred, so an
+    all-numeric Catalog column stays "2530516" instead of 2530516.0 and
+    leading zeros survive. CSV files are memory-mapped so the parser reads
+    straight from the page cache instead of copying the file through read()
+    calls. Excel files use the calamine engine when python-calamine is
+    installed, else pandas' default (openpyxl / xlrd).
+    """
+    text_dtypes = {col: str for col in INPUT_TEXT_COLUMNS}
+    if input_path.suffix.lower() in [".xlsx", ".xls"]:
+        return pd.read_excel(input_path, engine=EXCEL_ENGINE, dtype=text_dtypes)
+    return pd.read_csv(input_path, memory_map=True, dtype=text_dtypes)
+
+
+def normalize_input_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column-wise cleanup of the input sheet before rows are dispatched.
+
+    Strips header names, drops rows that are entirely blank and turns the
+    text columns into stripped strings with NaN as "", stored as categoricals
+    where values repeat heavily. Rows that still lack an artist or title are
+    kept so they are reported as unmatched.
+    """
+    df = df.copy()
+    df.columns = df.columns.astype(str).str.strip()
+    df = df.dropna(how="all")
+    for col in INPUT_TEXT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].fillna("").astype(str).str.strip()
+    for col in INPUT_CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df.reset_index(drop=True)
+
+
+def iter_input_records(
+    df: pd.DataFrame, chunk_rows: int = INPUT_CHUNK_ROWS
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the sheet's rows as dicts, converting one slice at a time so the
+    whole sheet is never held as a list of dicts next to the DataFrame.
+    """
+    for start in range(0, len(df), chunk_rows):
+        yield from df.iloc[start : start + chunk_rows].to_dict(orient="records")
+
+
+def cell_text(row: Dict[str, Any], key: str) -> str:
+    """
+    A row cell as a stripped string; missing, None and NaN/NaT cells are "".
+    Already-clean strings (the normalized input columns) skip str().
+    """
+    v = row.get(key)
+    if v is None or v != v:
+        return ""
+    return v.strip() if isinstance(v, str) else str(v).strip()
+
+
+def blank_missing_cells(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a copy of an input-derived row with None/NaN/NaT cells as "",
+    matching what pandas' CSV writer emits for missing values.
+    """
+    # NaN and NaT are the only values that compare unequal to themselves.
+    return {k: "" if v is None or v != v else v for k, v in row.items()}
+
+
+class CsvRowStream:
+    """
+    Incremental CSV writer for fixed-schema outputs.
+
+    Rows are written while the run progresses instead of being held until
+    the end. Per-record rows are collected into batches of up to
+    CSV_WRITE_BATCH_ROWS and handed to a single writer thread through a
+    bounded queue, so the emitting thread (which also drives the progress
+    callback) never waits on disk I/O and the writer makes one writerows()
+    call per batch. The file is only created on the first write, so a run
+    with nothing to write leaves no empty CSV.
+
+    With extrasaction="ignore" the rows go through a plain csv.writer over
+    the fixed column order (missing cells blank), which is what DictWriter
+    would emit minus its per-row method calls; "raise" keeps DictWriter's
+    check for unexpected keys.
+    """
+
+    _FLUSH = object()
+
+    def __init__(
+        self,
+        path: Path,
+        fieldnames: List[str],
+        description: str,
+        extrasaction: str = "raise",
+    ) -> None:
+        self.path = path
+        self.fieldnames = fieldnames
+        self.description = description
+        self.extrasaction = extrasaction
+        self.rows_written = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=CSV_WRITE_QUEUE_SIZE)
+        self._pending: List[Dict[str, Any]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        if self._thread is None:
+            logger.info("Writing %s: %s", self.description, self.path)
+            self._thread = threading.Thread(
+                target=self._run, name=f"csv-writer-{self.path.name}", daemon=True
+            )
+            self._thread.start()
+        self._pending.extend(rows)
+        self.rows_written += len(rows)
+        if len(self._pending) >= CSV_WRITE_BATCH_ROWS:
+            self._hand_off()
+
+    def flush(self) -> None:
+        if self._thread is not None:
+            self._hand_off()
+            self._queue.put(self._FLUSH)
+
+    def close(self) -> None:
+        if self._thread is None:
+            logger.info("No rows; not writing %s.", self.description)
+            return
+        self._hand_off()
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._error is not None:
+            raise self._error
+
+    def _hand_off(self) -> None:
+        if self._pending:
+            self._queue.put(self._pending)
+            self._pending = []
+
+    def _run(self) -> None:
+        f = None
+        try:
+            f = self.path.open(
+                "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_BYTES
+            )
+            fields = self.fieldnames
+            if self.extrasaction == "ignore":
+                writer = csv.writer(f)
+                writer.writerow(fields)
+
+                def write_batch(batch: List[Dict[str, Any]]) -> None:
+                    writer.writerows([[r.get(k, "") for k in fields] for r in batch])
+            else:
+                dict_writer = csv.DictWriter(
+                    f, fieldnames=fields, extrasaction=self.extrasaction
+                )
+                dict_writer.writeheader()
+                write_batch = dict_writer.writerows
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                if item is self._FLUSH:
+                    f.flush()
+                else:
+                    write_batch(item)
+        except BaseException as e:
+            self._error = e
+            logger.error("Failed writing %s (%s): %s", self.description, self.path, e)
+            # Keep draining so producers never block on a dead writer.
+            while self._queue.get() is not None:
+                pass
+        finally:
+            if f is not None:
+                f.close()
+
+
 # ---------------------------------------------------------------------------
 # Main processing loop
 # ---------------------------------------------------------------------------
@@ -1357,69 +1714,68 @@ def process_file(
         prefer_ipv4=True,
     )
     core_discogs_client = CoreDiscogsClient(token=discogs_token)
+    # Discogs responses are memoized in memory for this run only; the on-disk
+    # response store (with per-endpoint TTLs) is what carries them across runs.
+    discogs_client.clear_release_cache()
 
-    if input_path.suffix.lower() in [".xlsx", ".xls"]:
-        df = pd.read_excel(input_path)
-    else:
-        df = pd.read_csv(input_path)
+    df = normalize_input_frame(read_input(input_path))
 
-    records = df.to_dict(orient="records")
-    total_rows = len(records)
+    total_rows = len(df)
+    if COL_PRICE in df.columns:
+        reference_prices = parse_price_column(df[COL_PRICE])
+    else:
+        reference_prices = [None] * total_rows
+    # Use explicit Year column only (Type does not contain year).
+    if COL_YEAR in df.columns:
+        sheet_years = parse_year_column(df[COL_YEAR])
+    else:
+        sheet_years = [None] * total_rows
     logger.info("Loaded %d rows from input.", total_rows)
 
-    matched_rows: List[Dict[str, Any]] = []
-    unmatched_rows: List[Dict[str, Any]] = []
-    metafield_rows: List[Dict[str, Any]] = []
-    retry_rows: List[Tuple[int, Dict[str, Any], Dict[str, Any]]] = []
+    matched_count = 0
+    # Delayed second lookups for rows whose details fetch failed transiently;
+    # their outcomes are emitted after the first pass, in scheduling order.
+    retry_jobs: List[Tuple[int, Dict[str, Any], "Future[Dict[str, Any]]"]] = []
     total_final_price = 0.0
     total_reference_price = 0.0
-    shopify_errors: List[Dict[str, str]] = []
+    shopify_error_count = 0
     musicbrainz_match_count = 0
 
     handle_registry: Dict[str, int] = {}
 
-    def process_single_row(idx: int, row: Dict[str, Any], allow_retry: bool = True) -> None:
-        nonlocal total_final_price, total_reference_price, musicbrainz_match_count
-        artist = str(row.get(COL_ARTIST, "")).strip()
-        title = str(row.get(COL_TITLE, "")).strip()
-        country = str(row.get(COL_COUNTRY, "")).strip() or None
-        catalog = str(row.get(COL_CATALOG, "")).strip() or None
-        barcode = str(row.get("Variant Barcode", "") or "").strip() or None
-
-        # Use explicit Year column only (Type does not contain year).
-        year_raw = row.get(COL_YEAR, "")
-        year_val: Optional[int] = None
-        if year_raw:
-            try:
-                year_val = int(str(year_raw)[:4])
-            except Exception:
-                m = re.search(r"\b(19[0-9]{2}|20[0-2][0-9])\b", str(year_raw))
-                if m:
-                    try:
-                        year_val = int(m.group(1))
-                    except ValueError:
-                        year_val = None
-
-        mbid_provided = str(row.get(COL_MUSICBRAINZ_ALBUMID, "") or "").strip()
-        rgid_provided = str(row.get(COL_MUSICBRAINZ_RELEASEGROUPID, "") or "").strip()
-        format_hint = str(row.get(COL_TYPE, "") or "").strip()
+    def lookup_row(idx: int, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Network phase for one row: label OCR, MusicBrainz and Discogs lookups.
+
+        Runs on a worker thread, so it only returns an outcome dict and never
+        touches the shared output lists, totals or progress callback.
+        """
+        artist = cell_text(row, COL_ARTIST)
+        title = cell_text(row, COL_TITLE)
+        country = cell_text(row, COL_COUNTRY) or None
+        catalog = cell_text(row, COL_CATALOG) or None
+        barcode = cell_text(row, "Variant Barcode") or None
+
+        year_val = sheet_years[idx - 1]
+
+        mbid_provided = cell_text(row, COL_MUSICBRAINZ_ALBUMID)
+        rgid_provided = cell_text(row, COL_MUSICBRAINZ_RELEASEGROUPID)
+        format_hint = cell_text(row, COL_TYPE)
 
         if not artist or not title:
-            unmatched_rows.append(
-                {
+            return {
+                "status": "unmatched",
+                "row": {
                     "Reason": "Missing artist or title",
                     **row,
-                }
-            )
-            if progress_callback:
-                progress_callback(idx, total_rows)
-            return
+                },
+            }
 
         meta: Dict[str, Any] = {
             "Artist": artist,
             "Title": title,
             "Catalog Number": catalog,
-            "Label": str(row.get("Label", "")).strip(),
+            "Label": cell_text(row, "Label"),
             "Country": country,
             "Year": year_val,
         }
@@ -1601,9 +1957,13 @@ def process_file(
             logger.info("Row %d: searching Discogs for %s", idx, enriched_query)
 
         # ------------------------------------------------------------------
-        # FIRST ATTEMPT: *loose* search – artist + title (+ country).
-        # Do NOT filter by catalog or year here; that over-constrains things
-        # and can break cases where spreadsheet/OCR year or catalog are off.
+        # Search attempts, in order, stopping at the first hit:
+        # 1) *loose* search – artist + title (+ country). Do NOT filter by
+        #    catalog or year here; that over-constrains things and can break
+        #    cases where spreadsheet/OCR year or catalog are off.
+        # 2) OCR catalog only, relaxing country/year.
+        # 3) sheet catalog only, relaxing country/year – skipped when it is
+        #    the same catalog as (2), since Discogs would get the same query.
         # ------------------------------------------------------------------
         release_id = None
         search_obj: Dict[str, Any] = {}
@@ -1611,124 +1971,101 @@ def process_file(
             release_id = row_match.discogs_release_id
             search_obj = {"id": release_id, "title": row_match.title, "artist": row_match.artist}
         else:
-            search_obj = discogs_search_release(
-                discogs_token,
-                artist,
-                title,
-                country,
-                None,   # no catalog filter
-                None,   # no year filter
-            )
-
-        # ------------------------------------------------------------------
-        # SECOND ATTEMPT: if no result and we DO have an OCR catalog,
-        # retry with OCR catalog, relaxing country/year.
-        # ------------------------------------------------------------------
-        if not search_obj and catalog_ocr:
-            logger.info(
-                "Row %d: no match on primary search; retrying with OCR catalog only: %s",
-                idx,
-                catalog_ocr,
-            )
-            search_obj = discogs_search_release(
-                discogs_token,
-                artist,
-                title,
-                None,          # relax country
-                catalog_ocr,   # OCR-derived catalog
-                None,          # relax year
-            )
+            # (log message, country, catalog); year is never filtered on.
+            attempts: List[Tuple[Optional[str], Optional[str], Optional[str]]] = [
+                (None, country, None)
+            ]
+            if catalog_ocr:
+                attempts.append(
+                    ("no match on primary search; retrying with OCR catalog only", None, catalog_ocr)
+                )
+            if catalog_sheet and (
+                not catalog_ocr or catalog_sheet.casefold() != catalog_ocr.casefold()
+            ):
+                attempts.append(
+                    ("still no result; retrying with sheet catalog only", None, catalog_sheet)
+                )
 
-        # ------------------------------------------------------------------
-        # THIRD ATTEMPT: if still no result, try the sheet catalog only
-        # (if it's different from the OCR catalog).
-        # ------------------------------------------------------------------
-        if not search_obj and catalog_sheet and catalog_sheet != catalog_ocr:
-            logger.info(
-                "Row %d: still no result; retrying with sheet catalog only: %s",
-                idx,
-                catalog_sheet,
-            )
-            search_obj = discogs_search_release(
-                discogs_token,
-                artist,
-                title,
-                None,          # relax country
-                catalog_sheet, # sheet-derived catalog
-                None,          # relax year
-            )
+            for message, search_country, search_catalog in attempts:
+                if message:
+                    logger.info("Row %d: %s: %s", idx, message, search_catalog)
+                search_obj = discogs_search_release(
+                    discogs_token,
+                    artist,
+                    title,
+                    search_country,
+                    search_catalog,
+                    None,
+                )
+                if search_obj:
+                    break
 
         if not search_obj:
-            unmatched_rows.append(
-                {
+            return {
+                "status": "unmatched",
+                "row": {
                     "Reason": "Discogs search returned no results (after OCR retry)",
                     "Discogs_Query_Used": enriched_query,
                     "Catalog_Used_Sheet": catalog_sheet or "",
                     "Catalog_Used_OCR": catalog_ocr or "",
                     **row,
-                }
-            )
-            if progress_callback:
-                progress_callback(idx, total_rows)
-            return
+                },
+            }
 
         release_id = release_id or search_obj.get("id")
         if not release_id:
             logger.warning(
                 "Search result for row %d has no release ID; skipping.", idx
             )
-            unmatched_rows.append(
-                {
+            return {
+                "status": "unmatched",
+                "row": {
                     "Reason": "Discogs search result missing release ID",
                     "Discogs_Query_Used": enriched_query,
                     **row,
-                }
-            )
-            if progress_callback:
-                progress_callback(idx, total_rows)
-            return
+                },
+            }
 
-        # brief pause to ease rate limits
-        time.sleep(0.2)
+        # Marketplace data only needs the release id, so it is fetched on the
+        # side pool while this worker fetches the release details.
+        stats_future = None
+        if not (row_match and row_match.discogs_marketplace_stats):
+            stats_future = marketplace_executor.submit(
+                discogs_get_marketplace_stats, discogs_token, int(release_id)
+            )
+        suggestions_future = None
+        if not (row_match and row_match.discogs_price_suggestions):
+            suggestions_future = marketplace_executor.submit(
+                discogs_client.get_price_suggestions, discogs_token, int(release_id)
+            )
 
-        details = discogs_get_release_details(discogs_token, int(release_id))
+        details, details_status = discogs_get_release_details(discogs_token, int(release_id))
         if not details:
             logger.warning(
-                "Could not fetch details for release %s (row %d).",
+                "Could not fetch details for release %s (row %d, HTTP %s).",
                 release_id,
                 idx,
+                details_status,
             )
-            if allow_retry:
-                retry_rows.append((idx, row, enriched_query))
-            else:
-                unmatched_rows.append(
-                    {
-                        "Reason": f"Failed to fetch Discogs release details for ID {release_id}",
-                        "Discogs_Query_Used": enriched_query,
-                        **row,
-                    }
-                )
-            if progress_callback:
-                progress_callback(idx, total_rows)
-            return
-
-        market_stats = None
-        price_suggestions = None
+            return {
+                "status": "details_failed",
+                "release_id": release_id,
+                "http_status": details_status,
+                "enriched_query": enriched_query,
+            }
 
-        if row_match and row_match.discogs_marketplace_stats:
+        if stats_future is None:
             market_stats = row_match.discogs_marketplace_stats
         else:
-            market_stats = discogs_get_marketplace_stats(discogs_token, int(release_id))
+            market_stats = stats_future.result()
 
         if market_stats:
             details["_marketplace_stats"] = market_stats
 
-        if row_match and row_match.discogs_price_suggestions:
+        if suggestions_future is None:
             price_suggestions = row_match.discogs_price_suggestions
         else:
-            price_suggestions = discogs_client.get_price_suggestions(
-                discogs_token, int(release_id)
-            )
+            price_suggestions = suggestions_future.result()
         if price_suggestions:
             details["_price_suggestions"] = price_suggestions
 
@@ -1751,26 +2088,85 @@ def process_file(
             raw=details,
         )
 
+        return {
+            "status": "matched",
+            "search_obj": search_obj,
+            "details": details,
+            "misprint_info": misprint_info,
+            "release_match": release_match,
+        }
+
+    def emit_row(idx: int, row: Dict[str, Any], outcome: Dict[str, Any], allow_retry: bool) -> None:
+        """
+        Output phase for one row, run on the calling thread in input order:
+        records unmatched/retry rows, builds Shopify rows and updates totals.
+        """
+        nonlocal total_final_price, total_reference_price, musicbrainz_match_count, matched_count
+        nonlocal shopify_error_count
+        status = outcome["status"]
+        if status == "unmatched":
+            unmatched_out.write_rows([blank_missing_cells(outcome["row"])])
+            if progress_callback:
+                progress_callback(idx, total_rows)
+            return
+
+        if status == "details_failed":
+            # Only transient failures are worth the retry pass; a 4xx such as
+            # a 404 for a deleted release would fail the same way again.
+            http_status = outcome["http_status"]
+            if allow_retry and not discogs_client.is_permanent_failure(http_status):
+                logger.info(
+                    "Row %d: retrying Discogs lookup in %.0fs after a transient failure.",
+                    idx,
+                    RETRY_DELAY_SECONDS,
+                )
+                retry_jobs.append((idx, row, retry_executor.submit(delayed_lookup, idx, row)))
+            else:
+                reason = f"Failed to fetch Discogs release details for ID {outcome['release_id']}"
+                if http_status is not None:
+                    reason += f" (HTTP {http_status})"
+                unmatched_out.write_rows(
+                    [
+                        blank_missing_cells(
+                            {
+                                "Reason": reason,
+                                "Discogs_Query_Used": outcome["enriched_query"],
+                                **row,
+                            }
+                        )
+                    ]
+                )
+            if progress_callback:
+                progress_callback(idx, total_rows)
+            return
+
+        release_match = outcome["release_match"]
         if release_match.source == "musicbrainz":
             musicbrainz_match_count += 1
 
         shopify_rows, metafield_row, final_price_val, ref_price_val = make_shopify_rows_for_record(
             row,
-            search_obj,
-            details,
-            misprint_info,
+            outcome["search_obj"],
+            outcome["details"],
+            outcome["misprint_info"],
             handle_registry,
             release_match,
+            reference_price=reference_prices[idx - 1],
         )
-        matched_rows.extend(shopify_rows)
-        metafield_rows.append(metafield_row)
+        matched_count += 1
+        if products_out is not None and metafields_out is not None:
+            products_out.write_rows(shopify_rows)
+            metafields_out.write_rows([metafield_row])
+        if matched_count % CSV_FLUSH_EVERY_RECORDS == 0:
+            for stream in output_streams:
+                stream.flush()
         # Build and send ShopifyDraft immediately in API modes
         if shopify_mode in ("shopify", "both") and shopify_exporter:
             try:
                 # Collect all HTTP(S) image URLs from primary + additional image rows
                 image_urls: List[str] = []
                 for r in shopify_rows:
-                    img_src = str(r.get("Image Src", "") or "").strip()
+                    img_src = cell_text(r, "Image Src")
                     if img_src.lower().startswith(("http://", "https://")):
                         image_urls.append(img_src)
                 draft = row_to_shopify_draft(shopify_rows[0], image_urls=image_urls)
@@ -1782,19 +2178,25 @@ def process_file(
                     getattr(shopify_rows[0], "Handle", row.get("Handle", "")),
                     e,
                 )
-                shopify_errors.append(
-                    {
-                        "Handle": row.get("Handle", ""),
-                        "Title": row.get("Title", ""),
-                        "Reason": f"{e}",
-                    }
-                )
-                unmatched_rows.append(
-                    {
-                        "Reason": f"Shopify API create failed: {e}",
-                        "Handle": row.get("Handle", ""),
-                        "Title": row.get("Title", ""),
-                    }
+                shopify_error_count += 1
+                if errors_out is not None:
+                    errors_out.write_rows(
+                        [
+                            {
+                                "Handle": row.get("Handle", ""),
+                                "Title": row.get("Title", ""),
+                                "Reason": f"{e}",
+                            }
+                        ]
+                    )
+                unmatched_out.write_rows(
+                    [
+                        {
+                            "Reason": f"Shopify API create failed: {e}",
+                            "Handle": row.get("Handle", ""),
+                            "Title": row.get("Title", ""),
+                        }
+                    ]
                 )
         total_final_price += float(final_price_val or 0.0)
         if ref_price_val is not None:
@@ -1803,42 +2205,86 @@ def process_file(
         if progress_callback:
             progress_callback(idx, total_rows)
 
-    # First pass
-    for idx, row in enumerate(records, start=1):
-        process_single_row(idx, row, allow_retry=True)
-
-    # Second pass for rows that failed Discogs details
-    if retry_rows:
-        logger.info("Retrying %d rows with extended backoff after initial failures...", len(retry_rows))
-        time.sleep(2.0)
-        for idx, row, _enriched_query in retry_rows:
-            process_single_row(idx, row, allow_retry=False)
-
-    # Write matched CSV (products)
-    if shopify_mode in ("csv", "both") and matched_rows:
-        logger.info("Writing matched output CSV (products): %s", output_matched)
-        with output_matched.open("w", newline="", encoding="utf-8") as f:
-            fieldnames = sorted({k for r in matched_rows for k in r.keys()})
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for r in matched_rows:
-                writer.writerow(r)
-    elif shopify_mode in ("csv", "both"):
-        logger.info("No matched rows; not writing matched CSV.")
-
-    # Write unmatched CSV
-    if unmatched_rows:
-        logger.info("Writing unmatched output CSV: %s", output_not_matched)
-        with output_not_matched.open("w", newline="", encoding="utf-8") as f:
-            fieldnames = sorted({k for r in unmatched_rows for k in r.keys()})
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for r in unmatched_rows:
-                writer.writerow(r)
-    else:
-        logger.info("No unmatched rows; not writing unmatched CSV.")
+    def run_pass(items: Iterable[Tuple[int, Dict[str, Any]]]) -> None:
+        # Lookups overlap on the worker pool, at most LOOKUP_IN_FLIGHT rows
+        # ahead; outcomes are emitted in input order so handles, output order
+        # and progress stay deterministic. Row building (emit_row) deliberately
+        # stays on this thread: it costs milliseconds of CPU per row against
+        # seconds of rate-limited Discogs time, handle dedup must run serially,
+        # and worker processes would re-import this module's GUI/settings side
+        # effects.
+        with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+            pending: deque = deque()
+            for idx, row in items:
+                pending.append((idx, row, executor.submit(lookup_row, idx, row)))
+                if len(pending) >= LOOKUP_IN_FLIGHT:
+                    done_idx, done_row, future = pending.popleft()
+                    emit_row(done_idx, done_row, future.result(), allow_retry=True)
+            while pending:
+                done_idx, done_row, future = pending.popleft()
+                emit_row(done_idx, done_row, future.result(), allow_retry=True)
+
+    # Every output CSV has columns known up front, so all of them are streamed
+    # record by record as rows are emitted. Unmatched rows carry the input
+    # sheet's columns plus the diagnostic columns any unmatched path may add.
+    unmatched_out = CsvRowStream(
+        output_not_matched,
+        sorted(set(df.columns) | set(UNMATCHED_EXTRA_COLUMNS)),
+        "unmatched output CSV",
+        extrasaction="ignore",
+    )
+    output_streams: List[CsvRowStream] = [unmatched_out]
+    products_out: Optional[CsvRowStream] = None
+    metafields_out: Optional[CsvRowStream] = None
+    if shopify_mode in ("csv", "both"):
+        products_out = CsvRowStream(
+            output_matched,
+            list(SHOPIFY_PRODUCT_CSV_COLUMNS),
+            "matched output CSV (products)",
+            extrasaction="ignore",
+        )
+        metafields_out = CsvRowStream(
+            output_metafields, list(METAFIELD_COLUMNS), "metafields output CSV"
+        )
+        output_streams += [products_out, metafields_out]
+    errors_out: Optional[CsvRowStream] = None
+    if shopify_mode in ("shopify", "both") and shopify_errors_path:
+        errors_out = CsvRowStream(
+            shopify_errors_path, ["Handle", "Title", "Reason"], "Shopify errors file"
+        )
+        output_streams.append(errors_out)
+
+    def delayed_lookup(idx: int, row: Dict[str, Any]) -> Dict[str, Any]:
+        time.sleep(RETRY_DELAY_SECONDS)
+        return lookup_row(idx, row)
+
+    # Side pool for per-row marketplace fetches (see lookup_row)
+    marketplace_executor = ThreadPoolExecutor(max_workers=2 * LOOKUP_WORKERS)
+    # Retries wait out their delay here, so they overlap the rest of the first
+    # pass instead of starting only after it.
+    retry_executor = ThreadPoolExecutor(max_workers=LOOKUP_WORKERS)
+
+    try:
+        run_pass(enumerate(iter_input_records(df), start=1))
+
+        if retry_jobs:
+            logger.info("Collecting %d retried rows...", len(retry_jobs))
+        for idx, row, future in retry_jobs:
+            emit_row(idx, row, future.result(), allow_retry=False)
+    finally:
+        retry_executor.shutdown(wait=True)
+        marketplace_executor.shutdown(wait=True)
+        # Close every stream even if one fails; the first failure is raised.
+        close_error: Optional[BaseException] = None
+        for stream in output_streams:
+            try:
+                stream.close()
+            except Exception as e:
+                close_error = close_error or e
+        if close_error is not None:
+            raise close_error
 
-    # Shopify API export (duplicates/errors already captured during per-row writes)
+    # Shopify API export (errors were streamed during per-row writes)
     duplicates: List[str] = []
     if shopify_mode in ("shopify", "both") and shopify_exporter:
         duplicates = getattr(shopify_exporter, "duplicates", [])
@@ -1846,43 +2292,20 @@ def process_file(
             try:
                 logger.info("Writing duplicate handles file: %s", shopify_duplicates_path)
                 with shopify_duplicates_path.open("w", encoding="utf-8") as f:
-                    for d in duplicates:
-                        f.write(f"{d}\n")
+                    f.writelines(f"{d}\n" for d in duplicates)
             except Exception as e:
                 logger.warning("Failed to write duplicates file: %s", e)
-        if shopify_errors_path and shopify_errors:
-            try:
-                logger.info("Writing Shopify errors file: %s", shopify_errors_path)
-                with shopify_errors_path.open("w", newline="", encoding="utf-8") as f:
-                    fieldnames = ["Handle", "Title", "Reason"]
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for r in shopify_errors:
-                        writer.writerow(r)
-            except Exception as e:
-                logger.warning("Failed to write Shopify errors file: %s", e)
-
-    # Write metafields CSV
-    if shopify_mode in ("csv", "both") and metafield_rows:
-        logger.info("Writing metafields output CSV: %s", output_metafields)
-        with output_metafields.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=list(metafield_rows[0].keys()))
-            writer.writeheader()
-            for r in metafield_rows:
-                writer.writerow(r)
-    elif shopify_mode in ("csv", "both"):
-        logger.info("No metafield rows; not writing metafields CSV.")
 
     summary = {
         "total_rows": total_rows,
-        "matched_count": len(metafield_rows),
-        "unmatched_count": len(unmatched_rows),
+        "matched_count": matched_count,
+        "unmatched_count": unmatched_out.rows_written,
         "total_final_price": round(total_final_price, 2),
         "total_reference_price": round(total_reference_price, 2),
         "price_diff": round(total_final_price - total_reference_price, 2),
         "shopify_uploaded": len(getattr(shopify_exporter, "created_ids", [])) if shopify_exporter else 0,
         "shopify_duplicates": len(duplicates) if shopify_mode in ("shopify", "both") else 0,
-        "shopify_errors": len(shopify_errors) if shopify_mode in ("shopify", "both") else 0,
+        "shopify_errors": shopify_error_count if shopify_mode in ("shopify", "both") else 0,
         "musicbrainz_matched_count": musicbrainz_match_count,
     }
     logger.info(
@@ -1999,6 +2422,7 @@ def run_gui() -> None:
             base_dir_var.set(str(new_base))
             globals()["BASE_DIR"] = new_base
             globals()["DIRS"] = ensure_base_dirs(new_base)
+            discogs_client.set_etag_cache_path(DIRS["cache"] / DISCOGS_ETAG_CACHE_NAME)
             dlg.destroy()
 
         ttk.Button(dlg, text="Save", command=save_base).grid(
@@ -2089,10 +2513,34 @@ def run_gui() -> None:
         log_text.configure(state="disabled")
 
     class TextHandler(logging.Handler):
+        """
+        Mirror log records into the log window. Records are only queued here;
+        the Tk thread writes whatever has accumulated in one insert every
+        LOG_WINDOW_FLUSH_MS, so a burst of log lines costs a handful of Tcl
+        calls instead of several per record (and worker threads never touch
+        Tk widgets, which may only be used from the thread that created them).
+        """
+
+        def __init__(self) -> None:
+            super().__init__()
+            self.pending: "queue.Queue[str]" = queue.Queue()
+
         def emit(self, record: logging.LogRecord) -> None:
-            msg = self.format(record)
+            self.pending.put(self.format(record))
+
+        def flush_pending(self) -> None:
+            lines: List[str] = []
+            while len(lines) < LOG_WINDOW_MAX_LINES_PER_FLUSH:
+                try:
+                    lines.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            if not lines:
+                return
             log_text.configure(state="normal")
-            log_text.insert(tk.END, msg + "\n")
+            log_text.insert(tk.END, "\n".join(lines) + "\n")
+            # "end" sits after the final newline, so keep one extra line.
+            log_text.delete("1.0", f"end-{LOG_WINDOW_MAX_LINES + 1}l")
             log_text.configure(state="disabled")
             log_text.see(tk.END)
 
@@ -2102,6 +2550,12 @@ def run_gui() -> None:
     )
     logging.getLogger().addHandler(handler)
 
+    def pump_log_window() -> None:
+        handler.flush_pending()
+        root.after(LOG_WINDOW_FLUSH_MS, pump_log_window)
+
+    root.after(LOG_WINDOW_FLUSH_MS, pump_log_window)
+
     output_msg_var = tk.StringVar(value="")
 
     def open_matched() -> None:
@@ -2250,83 +2704,117 @@ def run_gui() -> None:
 
         progress["value"] = 0
 
+        # process_file runs on a worker thread so the window stays responsive
+        # while rows wait on Discogs/MusicBrainz. Progress and the final
+        # outcome come back through this queue and are applied by the Tk
+        # thread in poll_job, since only that thread may touch widgets.
+        events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+
         def progress_cb(done: int, total: int) -> None:
-            if total > 0:
-                pct = int((done / total) * 100)
-                progress["value"] = pct
-                root.update_idletasks()
+            events.put(("progress", (done, total)))
 
-        try:
-            summary = process_file(
-                input_path=input_path,
-                discogs_token=token_str,
-                output_matched=output_matched,
-                output_not_matched=output_not_matched,
-                output_metafields=output_metafields,
-                progress_callback=progress_cb,
-                shopify_mode=shopify_mode,
-                shopify_exporter=shopify_exporter,
-                shopify_duplicates_path=shopify_duplicates_path,
-                shopify_errors_path=shopify_errors_path,
+        def run_job() -> None:
+            try:
+                summary = process_file(
+                    input_path=input_path,
+                    discogs_token=token_str,
+                    output_matched=output_matched,
+                    output_not_matched=output_not_matched,
+                    output_metafields=output_metafields,
+                    progress_callback=progress_cb,
+                    shopify_mode=shopify_mode,
+                    shopify_exporter=shopify_exporter,
+                    shopify_duplicates_path=shopify_duplicates_path,
+                    shopify_errors_path=shopify_errors_path,
+                )
+            except Exception as e:
+                logger.exception("Error during processing: %s", e)
+                events.put(("error", e))
+            else:
+                events.put(("done", summary))
+
+        def poll_job() -> None:
+            outcome: Optional[Tuple[str, Any]] = None
+            while True:
+                try:
+                    kind, payload = events.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "progress":
+                    done, total = payload
+                    if total > 0:
+                        progress["value"] = int((done / total) * 100)
+                else:
+                    outcome = (kind, payload)
+
+            if outcome is None:
+                root.after(PROGRESS_POLL_MS, poll_job)
+                return
+
+            kind, payload = outcome
+            handler.flush_pending()
+            if kind == "error":
+                messagebox.showerror("Error", f"An error occurred:\n{payload}")
+                if start_button:
+                    start_button.state(["!disabled"])
+                return
+            finish_processing(payload)
+
+        def finish_processing(summary: Dict[str, Any]) -> None:
+            try:
+                dest = DIRS["processed"] / (
+                    input_path.stem + f"_Processed_{ts}{input_path.suffix}"
+                )
+                shutil.move(str(input_path), dest)
+                logger.info("Moved processed input to %s", dest)
+            except Exception as e:
+                logger.warning("Could not move processed input: %s", e)
+
+            last_outputs["matched"] = output_matched
+            last_outputs["not_matched"] = output_not_matched
+            last_outputs["metafields"] = output_metafields
+
+            msg = (
+                "Processing complete.\n"
+                f"Matched: {output_matched}\n"
+                f"Not matched: {output_not_matched}\n"
+                f"Metafields: {output_metafields}\n"
+                f"Totals: processed={summary['total_rows']}, matched={summary['matched_count']}, "
+                f"unmatched={summary['unmatched_count']}, "
+                f"final_sum=${summary['total_final_price']:.2f}, "
+                f"ref_sum=${summary['total_reference_price']:.2f}, "
+                f"diff=${summary['price_diff']:.2f}\n"
+                f"Shopify uploaded={summary.get('shopify_uploaded', 0)}, "
+                f"duplicates={summary.get('shopify_duplicates', 0)}, "
+                f"errors={summary.get('shopify_errors', 0)}\n"
+                f"Logs: {DIRS['logs']}\n"
+            )
+            output_msg_var.set(msg)
+
+            logger.info("\nDone.")
+            messagebox.showinfo(
+                "Complete",
+                "Processing complete.\n\n"
+                "Files created:\n"
+                f"  - {output_matched.name}\n"
+                f"  - {output_not_matched.name}\n"
+                f"  - {output_metafields.name}\n\n"
+                "Summary:\n"
+                f"  Processed: {summary['total_rows']}\n"
+                f"  Matched: {summary['matched_count']}\n"
+                f"  Unmatched: {summary['unmatched_count']}\n"
+                f"  Final sum: ${summary['total_final_price']:.2f}\n"
+                f"  Ref sum: ${summary['total_reference_price']:.2f}\n"
+                f"  Difference: ${summary['price_diff']:.2f}\n"
+                f"  Shopify uploaded: {summary.get('shopify_uploaded', 0)}\n"
+                f"  Shopify duplicates: {summary.get('shopify_duplicates', 0)}\n"
+                f"  Shopify errors: {summary.get('shopify_errors', 0)}\n",
             )
-        except Exception as e:
-            logger.exception("Error during processing: %s", e)
-            messagebox.showerror("Error", f"An error occurred:\n{e}")
             if start_button:
                 start_button.state(["!disabled"])
-            return
 
-        try:
-            dest = DIRS["processed"] / (
-                input_path.stem + f"_Processed_{ts}{input_path.suffix}"
-            )
-            shutil.move(str(input_path), dest)
-            logger.info("Moved processed input to %s", dest)
-        except Exception as e:
-            logger.warning("Could not move processed input: %s", e)
-
-        last_outputs["matched"] = output_matched
-        last_outputs["not_matched"] = output_not_matched
-        last_outputs["metafields"] = output_metafields
-
-        msg = (
-            "Processing complete.\n"
-            f"Matched: {output_matched}\n"
-            f"Not matched: {output_not_matched}\n"
-            f"Metafields: {output_metafields}\n"
-            f"Totals: processed={summary['total_rows']}, matched={summary['matched_count']}, "
-            f"unmatched={summary['unmatched_count']}, "
-            f"final_sum=${summary['total_final_price']:.2f}, "
-            f"ref_sum=${summary['total_reference_price']:.2f}, "
-            f"diff=${summary['price_diff']:.2f}\n"
-            f"Shopify uploaded={summary.get('shopify_uploaded', 0)}, "
-            f"duplicates={summary.get('shopify_duplicates', 0)}, "
-            f"errors={summary.get('shopify_errors', 0)}\n"
-            f"Logs: {DIRS['logs']}\n"
-        )
-        output_msg_var.set(msg)
-
-        logger.info("\nDone.")
-        messagebox.showinfo(
-            "Complete",
-            "Processing complete.\n\n"
-            "Files created:\n"
-            f"  - {output_matched.name}\n"
-            f"  - {output_not_matched.name}\n"
-            f"  - {output_metafields.name}\n\n"
-            "Summary:\n"
-            f"  Processed: {summary['total_rows']}\n"
-            f"  Matched: {summary['matched_count']}\n"
-            f"  Unmatched: {summary['unmatched_count']}\n"
-            f"  Final sum: ${summary['total_final_price']:.2f}\n"
-            f"  Ref sum: ${summary['total_reference_price']:.2f}\n"
-            f"  Difference: ${summary['price_diff']:.2f}\n"
-            f"  Shopify uploaded: {summary.get('shopify_uploaded', 0)}\n"
-            f"  Shopify duplicates: {summary.get('shopify_duplicates', 0)}\n"
-            f"  Shopify errors: {summary.get('shopify_errors', 0)}\n",
-        )
-        if start_button:
-            start_button.state(["!disabled"])
+        threading.Thread(target=run_job, name="process-file", daemon=True).start()
+        root.after(PROGRESS_POLL_MS, poll_job)
 
     start_button = ttk.Button(mainframe, text="Start", command=start_processing)
     start_button.grid(
@@ -2341,83 +2829,9 @@ def run_gui() -> None:
 # ---------------------------------------------------------------------------
 
 
-def main(argv: Optional[List[str]] = None) -> int:
-    if argv is None:
-        argv = sys.argv[1:]
-
-    # Default to GUI if no args or --gui present
-    if "--gui" in argv or not argv:
-        run_gui()
-        return 0
-
-    # CLI mode
-    import argparse
-
-    parser = argparse.ArgumentParser(
-        description="Discogs → Shopify vinyl import"
-    )
-    parser.add_argument("input_file", help="Input inventory CSV or XLSX file")
-    parser.add_argument(
-        "--discogs-token",
-        help="Discogs API token (or set DISCOGS_TOKEN env var)",
-    )
-    parser.add_argument(
-        "--output-dir",
-        help="Output directory (default: directory of input file)",
-        default=None,
-    )
-    args = parser.parse_args(argv)
-
-    token = args.discogs_token or os.getenv("DISCOGS_TOKEN")
-    if not token:
-        print(
-            "Error: Discogs token not provided. "
-            "Use --discogs-token or set DISCOGS_TOKEN.",
-            file=sys.stderr,
-        )
-        return 1
-
-    input_path = Path(args.input_file)
-    if not input_path.exists():
-        print(
-            f"Error: input file does not exist: {input_path}",
-            file=sys.stderr,
-        )
-        return 1
-
-    out_dir = Path(args.output_dir) if args.output_dir else DIRS["output"]
-    output_matched = out_dir / (
-        input_path.stem + "_Output for matched records.csv"
-    )
-    output_not_matched = out_dir / (input_path.stem + "_Not_Matched.csv")
-    output_metafields = out_dir / (
-        input_path.stem + "_Metafields for matched records.csv"
-    )
-
-    print_run_banner()
-
-    summary = process_file(
-        input_path=input_path,
-        discogs_token=token,
-        output_matched=output_matched,
-        output_not_matched=output_not_matched,
-        output_metafields=output_metafields,
-        progress_callback=None,
-    )
-
-    print("Done.")
-    print(
-        f"Summary: total={summary['total_rows']} matched={summary['matched_count']} "
-        f"unmatched={summary['unmatched_count']} final_sum={summary['total_final_price']:.2f} "
-        f"ref_sum={summary['total_reference_price']:.2f} diff={summary['price_diff']:.2f} "
-        f"mb_matched={summary.get('musicbrainz_matched_count', 0)}"
-    )
-    return 0
-
-
 def main(argv: Optional[List[str]] = None) -> int:
     """
-    CLI entry point (overrides earlier definition) with Shopify API options.
+    CLI entry point with Shopify API options.
     """
     if argv is None:
         argv = sys.argv[1:]
@@ -41,6 +41,10 @@ EBAY_BROWSE_URL = "https://api.ebay.com/buy/browse/v1/item_summary/search"
 _TOKEN: Optional[str] = None
 _TOKEN_EXPIRY: float = 0.0
 
+# One Session for the OAuth and Browse calls, so the TLS connection to
+# api.ebay.com is kept alive between requests instead of re-handshaking.
+_SESSION = requests.Session()
+
 
 # ---------------------------------------------------------------------------
 # Helper functions
@@ -89,7 +93,7 @@ def _get_token() -> Optional[str]:
     }
 
     try:
-        resp = requests.post(EBAY_OAUTH_URL, headers=headers, data=data, timeout=20)
+        resp = _SESSION.post(EBAY_OAUTH_URL, headers=headers, data=data, timeout=20)
     except Exception as e:
         logging.warning("eBay OAuth request failed: %s", e)
         return None
@@ -217,7 +221,7 @@ def search_ebay_active_vinyl(
     }
 
     try:
-        resp = requests.get(EBAY_BROWSE_URL, headers=headers, params=params, timeout=20)
+        resp = _SESSION.get(EBAY_BROWSE_URL, headers=headers, params=params, timeout=20)
     except Exception as e:
         logging.warning("Browse ACTIVE request failed: %s", e)
         return []
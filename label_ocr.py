@@ -39,6 +39,7 @@ import logging
 import os
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Mapping, Optional
 
@@ -67,6 +68,10 @@ except Exception:
     URL_DOWNLOAD_ENABLED = False
     logging.warning("requests not available; URL-based label OCR will be disabled.")
 
+# Shared Session so label downloads from the same image host reuse
+# keep-alive connections instead of a new TCP/TLS handshake per image.
+_SESSION = requests.Session() if requests is not None else None
+
 logging.warning(
     "label_ocr.py loaded: OCR_AVAILABLE=%s, URL_DOWNLOAD_ENABLED=%s",
     OCR_AVAILABLE,
@@ -142,11 +147,14 @@ def _clean_ocr_text(value: str, allow_newlines: bool = False) -> str:
 # File / URL helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def _get_cache_dir() -> Path:
     """
     Cache directory for downloaded label images, e.g.:
 
         ~/.discogs_to_shopify/ocr_cache/
+
+    Resolved (and its folder created) once per process.
     """
     home = Path.home()
     base = home / ".discogs_to_shopify" / "ocr_cache"
@@ -190,32 +198,35 @@ def _download_image_to_cache(url: str) -> Optional[str]:
     logging.info("Label OCR: downloading label image for OCR: %s -> %s", url_str, dest)
 
     try:
-        resp = requests.get(url_str, stream=True, timeout=30)
+        resp = _SESSION.get(url_str, stream=True, timeout=30)
     except Exception as e:
         logging.warning("Failed to download label image %s: %s", url_str, e)
         return None
 
-    if not resp.ok:
-        logging.warning(
-            "Failed to download label image %s: HTTP %s",
-            url_str,
-            resp.status_code,
-        )
-        return None
+    # Closing the streamed response hands its connection back to the
+    # session pool, including on the early-return paths.
+    with resp:
+        if not resp.ok:
+            logging.warning(
+                "Failed to download label image %s: HTTP %s",
+                url_str,
+                resp.status_code,
+            )
+            return None
 
-    try:
-        with dest.open("wb") as f:
-            for chunk in resp.iter_content(chunk_size=8192):
-                if not chunk:
-                    continue
-                f.write(chunk)
-    except Exception as e:
-        logging.warning("Failed to write cached label image %s: %s", dest, e)
         try:
-            dest.unlink(missing_ok=True)
-        except Exception:
-            pass
-        return None
+            with dest.open("wb") as f:
+                for chunk in resp.iter_content(chunk_size=8192):
+                    if not chunk:
+                        continue
+                    f.write(chunk)
+        except Exception as e:
+            logging.warning("Failed to write cached label image %s: %s", dest, e)
+            try:
+                dest.unlink(missing_ok=True)
+            except Exception:
+                pass
+            return None
 
     return str(dest)
 
@@ -585,6 +596,10 @@ def enrich_meta_with_label(
 import re
 import unicodedata
 
+# sanitize_for_discogs runs once per row; compile its patterns at import.
+_QUERY_JUNK_RE = re.compile(r"[^A-Za-z0-9 ]+")
+_QUERY_SPACES_RE = re.compile(r"\s+")
+
 def sanitize_for_discogs(q: str) -> str:
     """
     Normalize and strip punctuation so Discogs search sees clean ASCII tokens.
@@ -606,10 +621,10 @@ def sanitize_for_discogs(q: str) -> str:
     q = q.replace("–", " ").replace("—", " ")
 
     # Remove everything except letters, digits, and spaces
-    q = re.sub(r"[^A-Za-z0-9 ]+", " ", q)
+    q = _QUERY_JUNK_RE.sub(" ", q)
 
     # Collapse multiple spaces
-    q = re.sub(r"\s+", " ", q)
+    q = _QUERY_SPACES_RE.sub(" ", q)
 
     return q.strip()
 
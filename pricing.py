@@ -405,6 +405,97 @@ def _extract_price_value(stats: Optional[dict], key: str) -> Optional[float]:
         return None
 
 
+def normalize_discogs_suggestion_key(key: str) -> Optional[str]:
+    """
+    Map Discogs price suggestion condition labels to our normalized ladder.
+    """
+    k = key.lower()
+    if "mint (m)" in k and "near" not in k:
+        return "M"
+    if "near mint" in k or "m-" in k:
+        return "NM"
+    if "vg+" in k or "very good plus" in k or "excellent" in k:
+        return "VG+"
+    if "very good" in k and "+" not in k:
+        return "VG"
+    if "good plus" in k or "g+" in k:
+        return "G+"
+    if k.startswith("good"):
+        return "G"
+    if "fair" in k or "poor" in k:
+        return "F/P"
+    return None
+
+
+# Position of each condition on the ladder (0 = best), for O(1) lookups.
+_LADDER_INDEX: Dict[str, int] = {c: i for i, c in enumerate(CONDITION_LADDER)}
+
+
+def _normalize_suggestions(suggestions: Dict[str, Any]) -> Dict[str, float]:
+    """Map Discogs price-suggestion keys to ladder values -> price."""
+    norm_map: Dict[str, float] = {}
+    for key, obj in suggestions.items():
+        if not isinstance(obj, dict):
+            continue
+        norm_key = normalize_discogs_suggestion_key(str(key))
+        if not norm_key:
+            continue
+        try:
+            val = obj.get("value")
+            price_val = float(val) if val is not None else None
+        except (TypeError, ValueError):
+            price_val = None
+        if price_val is not None:
+            norm_map[norm_key] = price_val
+
+    return norm_map
+
+
+def discogs_price_from_suggestions(
+    media_condition: str,
+    suggestions: Dict[str, Any],
+) -> Optional[float]:
+    """
+    Pick a price suggestion based on media condition.
+
+    - Exact match: use that value.
+    - Otherwise: take the next lower condition (if present) minus 10%.
+    - If no lower condition is available: take the next higher condition minus 10%.
+    - Sleeve condition is ignored.
+    """
+    if not suggestions:
+        return None
+
+    norm_media = normalize_condition(media_condition)
+    if not norm_media:
+        return None
+
+    norm_map = _normalize_suggestions(suggestions)
+    if not norm_map:
+        return None
+
+    if norm_media in norm_map:
+        return norm_map[norm_media]
+
+    idx = _LADDER_INDEX.get(norm_media)
+    if idx is None:
+        return None
+
+    # Search next lower condition first
+    for j in range(idx + 1, len(CONDITION_LADDER)):
+        cond = CONDITION_LADDER[j]
+        if cond in norm_map:
+            return norm_map[cond] * 0.9
+
+    # Then search next higher condition
+    for j in range(idx - 1, -1, -1):
+        cond = CONDITION_LADDER[j]
+        if cond in norm_map:
+            return norm_map[cond] * 0.9
+
+    return None
+
+
 def pricing_context_from_match(
     match: _Any,
     media_condition: Optional[str],